@@ -9,12 +9,6 @@ from pathlib import Path
 from .npc import NPC, NPCMemory
 from .manager import AIManager
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class DialogueType(Enum):
@@ -7,12 +7,6 @@ import asyncio
 
 from .npc import NPC, NPCRole, NPCPersonality, NPCMemory, NPCSchedule
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class AIManager:
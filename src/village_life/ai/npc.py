@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum, auto
+import sys
 
 class NPCRole(Enum):
     VILLAGER = auto()
@@ -31,10 +32,37 @@ class NPCMemory:
     facts_learned: List[str]
     importance: float = 0.5  # 0-1, how important this memory is
 
-@dataclass
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+@dataclass(slots=True)
 class NPCSchedule:
     daily_routine: Dict[int, str] = field(default_factory=dict)  # hour -> activity
     weekly_events: Dict[str, List[str]] = field(default_factory=dict)  # day -> events
+    activity_by_hour: Tuple[Optional[str], ...] = field(default=(), init=False, repr=False, compare=False)  # Indexed by hour
+    event_by_weekday: Tuple[Optional[str], ...] = field(default=(), init=False, repr=False, compare=False)  # Indexed by weekday()
+    
+    def __post_init__(self):
+        # Hours come back as strings from JSON saves; activity names repeat across NPCs
+        self.daily_routine = {
+            int(hour): sys.intern(activity)
+            for hour, activity in self.daily_routine.items()
+        }
+        self.weekly_events = {
+            sys.intern(day): [sys.intern(event) for event in events]
+            for day, events in self.weekly_events.items()
+        }
+        self.invalidate()
+    
+    def invalidate(self) -> None:
+        """Rebuild the lookup tables after the routine or events are modified."""
+        activity_by_hour: List[Optional[str]] = [None] * 24
+        for hour, activity in self.daily_routine.items():
+            activity_by_hour[hour] = activity
+        self.activity_by_hour = tuple(activity_by_hour)
+        self.event_by_weekday = tuple(
+            f"Attending {events[0]}" if events else None
+            for events in (self.weekly_events.get(day) for day in _WEEKDAYS)
+        )
 
 @dataclass
 class NPC:
@@ -50,19 +78,12 @@ class NPC:
     
     def get_current_activity(self, time: datetime) -> str:
         """Get the NPC's current activity based on time."""
-        # Check weekly events first
-        day = time.strftime("%A")
-        if day in self.schedule.weekly_events:
-            for event in self.schedule.weekly_events[day]:
-                return f"Attending {event}"
-        
-        # Check daily routine
-        hour = time.hour
-        if hour in self.schedule.daily_routine:
-            return self.schedule.daily_routine[hour]
-        
-        # Default activity
-        return "resting"
+        # Weekly events take precedence over the daily routine
+        return (
+            self.schedule.event_by_weekday[time.weekday()]
+            or self.schedule.activity_by_hour[time.hour]
+            or "resting"
+        )
     
     def get_response_context(self, conversation_context: dict) -> dict:
         """Get context for generating responses."""
@@ -13,20 +13,28 @@ S = TypeVar('S')
 
 class Identifier(Protocol):
     """Protocol for objects that can be uniquely identified."""
+    __slots__ = ()  # Lets implementations use __slots__
+    
     @property
     def id(self) -> str: ...
 
 class Modifiable(Protocol):
     """Protocol for objects that can be modified."""
+    __slots__ = ()
+    
     def apply_modifier(self, modifier: 'IModifier') -> 'Modifiable': ...
 
 class IModifier(Protocol):
     """Protocol for modifier objects that can change other objects."""
+    __slots__ = ()
+    
     def modify(self, target: Any) -> Any: ...
     def combine(self, other: 'IModifier') -> 'IModifier': ...
 
 class IResource(Identifier, Modifiable, Protocol):
     """Protocol for resource objects."""
+    __slots__ = ()
+    
     @property
     def quantity(self) -> float: ...
     
@@ -42,6 +50,8 @@ class IResource(Identifier, Modifiable, Protocol):
 
 class ITask(Identifier, Modifiable, Protocol):
     """Protocol for task objects."""
+    __slots__ = ()
+    
     @property
     def status(self) -> str: ...
     
@@ -54,6 +64,8 @@ class ITask(Identifier, Modifiable, Protocol):
 
 class IWeather(Protocol):
     """Protocol for weather objects."""
+    __slots__ = ()
+    
     @property
     def type(self) -> str: ...
     
@@ -90,24 +102,24 @@ class Event(Generic[T]):
 class EventBus:
     """Central event management system."""
     def __init__(self):
-        self._handlers: Dict[str, List[Callable[[Event], None]]] = {}
+        # Handler tuples are replaced, never mutated, so publish can iterate them safely
+        self._handlers: Dict[str, Tuple[Callable[[Event], None], ...]] = {}
     
     def subscribe(self, event_type: str, handler: Callable[[Event], None]) -> None:
         """Subscribe to an event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
     
     def unsubscribe(self, event_type: str, handler: Callable[[Event], None]) -> None:
         """Unsubscribe from an event type."""
         if event_type in self._handlers:
-            self._handlers[event_type].remove(handler)
+            handlers = list(self._handlers[event_type])
+            handlers.remove(handler)
+            self._handlers[event_type] = tuple(handlers)
     
     def publish(self, event: Event) -> None:
         """Publish an event to all subscribers."""
-        if event.type in self._handlers:
-            for handler in self._handlers[event.type]:
-                handler(event)
+        for handler in self._handlers.get(event.type, ()):
+            handler(event)
 
 class IPlugin(Protocol):
     """Protocol for plugin objects."""
@@ -2,10 +2,18 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from enum import Enum, auto
+import gzip
+import hashlib
 import json
 import yaml
 from pathlib import Path
 import time
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson is missing
+    orjson = None
+
 from village_life.ai import AIManager, DialogueManager, NPC, NPCRole, DialogueType
 from village_life.core.time_manager import TimeManager, Season
 from village_life.core.resource_manager import ResourceManager, ResourceType
@@ -14,12 +22,6 @@ from village_life.core.character import Character
 from village_life.core.weather_manager import WeatherManager
 import logging
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class SkillType(Enum):
@@ -120,6 +122,10 @@ class Game:
         # Load configuration
         self.config = self.load_config()
         
+        # Cached get_current_state() result, rebuilt after any mutation
+        self._cached_state: Optional[dict] = None
+        self._state_dirty = True
+        
         # For interpolation
         self.previous_state = None
         self.current_state = self.get_current_state()
@@ -127,6 +133,7 @@ class Game:
         # Village state
         self.npcs: Dict[str, NPC] = {}
         self.active_conversations: Dict[str, bool] = {}  # NPC ID -> is_talking
+        self._last_saves: Dict[str, Tuple[bytes, int, int]] = {}  # Slot -> (JSON digest, file mtime_ns, file size) of the last write
         
         logger.info("Game initialized")
     
@@ -141,10 +148,12 @@ class Game:
     def create_character(self, name: str) -> None:
         """Create a new character."""
         self.character = Character(name=name)
+        self._state_dirty = True
     
     def add_task(self, task: Task) -> None:
         """Add a new task to active tasks."""
         self.active_tasks.append(task)
+        self._state_dirty = True
     
     def complete_task(self, task: Task) -> None:
         """Mark a task as completed and apply rewards."""
@@ -154,6 +163,7 @@ class Game:
         task.completed = True
         self.active_tasks.remove(task)
         self.completed_tasks.append(task)
+        self._state_dirty = True
         
         # Apply rewards
         for skill_name, value in task.rewards.items():
@@ -240,51 +250,68 @@ class Game:
     def update(self) -> None:
         """Update game state using fixed time step."""
         if self.time_manager.update():  # Only update on fixed time step
-            # Store previous state for interpolation
-            self.previous_state = self.current_state
-            
-            # Get time passed and season effects
-            time_passed = timedelta(seconds=self.time_manager.fixed_time_step)
-            season_effects = self.time_manager.get_season_effects()
-            
-            # Update resources
-            self.resource_manager.update(time_passed, season_effects)
-            
-            # Update active tasks
-            current_time = datetime.now()
-            for task in self.active_tasks:
-                if task.started_at and task.duration:
-                    if current_time - task.started_at >= task.duration:
-                        # Apply seasonal effects to rewards
-                        if task.type == TaskType.CRAFTING:
-                            task.rewards = {
-                                k: v * season_effects.get("crafting", 1.0)
-                                for k, v in task.rewards.items()
-                            }
-                        elif task.type == TaskType.EXERCISE:
-                            task.rewards = {
-                                k: v * season_effects.get("energy_cost", 1.0)
-                                for k, v in task.rewards.items()
-                            }
-                        self.complete_task(task)
-            
-            # Update NPCs based on time of day
-            time_of_day = self.time_manager.get_time_of_day()
-            for npc in self.npcs.values():
-                activity = npc.get_current_activity(current_time)
-                if time_of_day == "night" and npc.id in self.active_conversations:
-                    # End conversations at night
-                    self.end_conversation(npc.id)
-            
-            # Store new state
-            self.current_state = self.get_current_state()
+            self._fixed_update()
+    
+    def tick(self, n: int = 1) -> None:
+        """Run n fixed time steps immediately, regardless of real time passed."""
+        for _ in range(n):
+            self.time_manager.step()
+            self._fixed_update()
+    
+    def _fixed_update(self) -> None:
+        """Advance game state by one fixed time step."""
+        self._state_dirty = True  # Time and resources move on every step
+        
+        # Store previous state for interpolation
+        self.previous_state = self.current_state
+        
+        # Get time passed and season effects
+        time_passed = timedelta(seconds=self.time_manager.fixed_time_step)
+        season_effects = self.time_manager.get_season_effects()
+        
+        # Update resources
+        self.resource_manager.update(time_passed, season_effects)
+        
+        # Update weather
+        self.weather_manager.update(time_passed, self.time_manager.game_date.season.name)
+        
+        # Update active tasks
+        current_time = datetime.now()
+        for task in self.active_tasks:
+            if task.started_at and task.duration:
+                if current_time - task.started_at >= task.duration:
+                    # Apply seasonal effects to rewards
+                    if task.type == TaskType.CRAFTING:
+                        task.rewards = {
+                            k: v * season_effects.get("crafting", 1.0)
+                            for k, v in task.rewards.items()
+                        }
+                    elif task.type == TaskType.EXERCISE:
+                        task.rewards = {
+                            k: v * season_effects.get("energy_cost", 1.0)
+                            for k, v in task.rewards.items()
+                        }
+                    self.complete_task(task)
+        
+        # Update NPCs based on time of day
+        if self.time_manager.get_time_of_day() == "night":
+            # End conversations at night
+            for npc_id in [i for i in self.active_conversations if i in self.npcs]:
+                self.end_conversation(npc_id)
+        
+        # Store new state
+        self.current_state = self.get_current_state()
     
     def get_current_state(self) -> dict:
         """Get current game state for interpolation."""
         if not self.character:
             return {}
+        
+        if not self._state_dirty and self._cached_state is not None:
+            return self._cached_state.copy()
             
-        return {
+        weather = self.weather_manager.get_current_weather()
+        self._cached_state = {
             "stats": self.character.stats.copy(),
             "skills": {k: v for k, v in self.character.skills.items()},
             "tasks": [(t.name, t.duration.total_seconds() if t.duration else 0) 
@@ -296,12 +323,18 @@ class Game:
                 "season_progress": self.time_manager.get_season_progress(),
                 "season_effects": self.time_manager.get_season_effects()
             },
+            "weather": {
+                "type": weather.type,
+                "intensity": weather.intensity
+            } if weather else {},
             "resources": self.resource_manager.get_storage_info()
         }
+        self._state_dirty = False
+        return self._cached_state.copy()
     
     def save_game(self, slot: str = "autosave") -> None:
         """Save the game state."""
-        save_path = self.save_dir / f"{slot}.json"
+        save_path = self.save_dir / f"{slot}.json.gz"
         
         save_data = {
             "time": self.time_manager.save_state(),
@@ -346,23 +379,49 @@ class Game:
                     "background": npc.background,
                     "skills": npc.skills,
                     "relationships": npc.relationships,
-                    "schedule": vars(npc.schedule)
+                    "schedule": {
+                        "daily_routine": npc.schedule.daily_routine,
+                        "weekly_events": npc.schedule.weekly_events
+                    }
                 }
                 for npc_id, npc in self.npcs.items()
             }
         }
         
-        with open(save_path, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        # Compact, gzip-compressed JSON: saves are read by the game, not by people
+        if orjson is not None:
+            payload = orjson.dumps(save_data, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(save_data, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        last_save = self._last_saves.get(slot)
+        if last_save is not None and last_save[0] == digest:
+            try:
+                stat = save_path.stat()
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == last_save[1:]:
+                return  # Nothing changed since this slot was last written
+        
+        with gzip.open(save_path, 'wb', compresslevel=3) as f:
+            f.write(payload)
+        stat = save_path.stat()
+        self._last_saves[slot] = (digest, stat.st_mtime_ns, stat.st_size)
     
     def load_game(self, slot: str = "autosave") -> bool:
         """Load a saved game state."""
-        save_path = self.save_dir / f"{slot}.json"
-        if not save_path.exists():
-            return False
-            
-        with open(save_path) as f:
-            save_data = json.load(f)
+        save_path = self.save_dir / f"{slot}.json.gz"
+        if save_path.exists():
+            with gzip.open(save_path, 'rb') as f:
+                raw = f.read()
+        else:
+            # Older saves are plain JSON
+            save_path = self.save_dir / f"{slot}.json"
+            if not save_path.exists():
+                return False
+            raw = save_path.read_bytes()
+        
+        save_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         # Restore manager states
         self.time_manager.load_state(save_data["time"])
@@ -409,6 +468,7 @@ class Game:
                 schedule=NPCSchedule(**npc_data["schedule"])
             )
         
+        self._state_dirty = True
         return True
     
     def get_interpolated_state(self) -> dict:
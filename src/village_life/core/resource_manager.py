@@ -12,14 +12,7 @@ import uuid
 
 from .abstractions.base import IResource, IModifier
 from .event_system import publish_event, ResourceEvent
-from .modifiers import create_modifier
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class ResourceCategory(Enum):
@@ -75,8 +68,12 @@ class ResourceType(Enum):
     SCROLLS = auto()
     POTIONS = auto()
     DECORATIONS = auto()
+    
+    # Members are singletons compared by identity, so hash by identity too
+    # instead of Enum's Python-level hash of the member name
+    __hash__ = object.__hash__
 
-@dataclass
+@dataclass(slots=True)
 class ResourceProperties:
     """Properties defining a resource type."""
     name: str
@@ -96,6 +93,8 @@ class ResourceProperties:
 
 class Resource(IResource):
     """Implementation of a resource stack."""
+    __slots__ = ("_id", "_type", "_properties", "_quantity", "_quality")
+    
     def __init__(self, 
                  resource_type: ResourceType,
                  properties: ResourceProperties,
@@ -159,6 +158,14 @@ class Resource(IResource):
             new_quality
         )
     
+    def decay(self, amount: float) -> float:
+        """Remove decayed units from this stack in place and return what remains."""
+        if amount < 0:
+            raise ValueError(f"Decay amount cannot be negative: {amount}")
+        
+        self._quantity = max(0.0, self._quantity - amount)
+        return self._quantity
+    
     def split(self, amount: float) -> Tuple['Resource', 'Resource']:
         """Split this resource stack into two parts."""
         if amount > self._quantity:
@@ -585,36 +592,47 @@ class ResourceManager:
     
     def get_storage_info(self) -> dict:
         """Get information about all stored resources."""
+        # One pass over storage instead of get_total_weight() plus a lookup per type
+        properties_by_type = self._properties
+        total_weight = 0.0
+        resources = []
+        for resource_type, resource in self._storage.items():
+            properties = properties_by_type[resource_type]
+            quantity = resource.quantity
+            quality = resource.quality
+            weight = properties.weight * quantity
+            total_weight += weight
+            resources.append({
+                "type": resource_type.name,
+                "quantity": quantity,
+                "quality": quality,
+                "value": properties.calculate_value(quantity, quality),
+                "weight": weight
+            })
+        
         return {
             "capacity": self._storage_capacity,
-            "total_weight": self.get_total_weight(),
-            "resources": [
-                self.get_resource_info(resource_type)
-                for resource_type in self._storage.keys()
-            ]
+            "total_weight": total_weight,
+            "resources": resources
         }
     
     def update(self, time_passed: timedelta, season_effects: dict) -> None:
         """Update resource states based on time passed."""
+        days = time_passed.total_seconds() / 86400.0
+        if days <= 0:
+            return
+        
         for resource_type, resource in list(self._storage.items()):
-            properties = self._properties[resource_type]
+            decay_rate = self._properties[resource_type].decay_rate
+            if not decay_rate:
+                continue
             
-            # Apply decay
-            decay = properties.decay_rate * time_passed.total_seconds() / 86400.0  # per day
-            if decay > 0:
-                decay_modifier = create_modifier("multiply", strength=1.0 - decay)
-                self._storage[resource_type] = resource.transform(decay_modifier)
-            
-            # Apply season effects
-            if resource_type.name in season_effects:
-                season_modifier = create_modifier(
-                    "multiply",
-                    strength=season_effects[resource_type.name]
-                )
-                self._storage[resource_type] = resource.transform(season_modifier)
+            # Season effects scale the daily decay of the matching resource
+            loss = decay_rate * season_effects.get(resource_type.name, 1.0) * days
             
-            # Remove empty stacks
-            if resource.quantity <= 0:
+            # Stored stacks never leave the manager, so they decay in place
+            if resource.decay(loss) <= 0:
+                # Remove empty stacks
                 del self._storage[resource_type]
     
     def save_state(self) -> dict:
@@ -4,9 +4,10 @@ Handles task management, progression, and rewards.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple, Any
 from datetime import datetime, timedelta
 from enum import Enum, auto
+import itertools
 import logging
 import random
 import uuid
@@ -16,14 +17,17 @@ from .event_system import publish_event, TaskEvent
 from .modifiers import create_modifier
 from .resource_manager import ResourceType
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Ids are a random per-process prefix plus a counter: unique across saved
+# sessions without paying for uuid4() on every task and template
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_id_counter = itertools.count()
+
+def generate_id(kind: str) -> str:
+    """Generate a unique id for a task, template or chain."""
+    return f"{kind}_{_ID_PREFIX}_{next(_id_counter):x}"
+
 class TaskType(Enum):
     """Types of tasks available in the game."""
     # Resource gathering
@@ -68,7 +72,13 @@ class TaskStatus(Enum):
     COMPLETED = auto()   # Successfully finished
     FAILED = auto()      # Failed to complete
 
-@dataclass
+# Status names used in task events, resolved once at import
+_AVAILABLE_NAME = TaskStatus.AVAILABLE.name
+_IN_PROGRESS_NAME = TaskStatus.IN_PROGRESS.name
+_COMPLETED_NAME = TaskStatus.COMPLETED.name
+_FAILED_NAME = TaskStatus.FAILED.name
+
+@dataclass(frozen=True, slots=True)
 class ResourceRequirement:
     """Resource requirement for a task."""
     type: ResourceType
@@ -76,7 +86,7 @@ class ResourceRequirement:
     min_quality: float = 0.0
     consumed: bool = True  # Whether the resource is consumed by the task
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceReward:
     """Resource reward for completing a task."""
     type: ResourceType
@@ -85,7 +95,7 @@ class ResourceReward:
     skill_multiplier: float = 1.0
     random_bonus: float = 0.0  # Random bonus percentage (0.0-1.0)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskPrerequisite:
     """Prerequisites for starting a task."""
     task_id: Optional[str] = None  # ID of required task
@@ -120,13 +130,15 @@ class Task(ITask):
         season_multipliers: Dict[str, float] = None,
         weather_requirements: List[str] = None,
         chain_id: Optional[str] = None,
-        event_id: Optional[str] = None
+        event_id: Optional[str] = None,
+        task_id: Optional[str] = None
     ):
-        self._id = str(uuid.uuid4())
+        self._id = task_id or generate_id("task")
         self._name = name
         self._description = description
         self._type = task_type
         self._duration = duration
+        self._duration_seconds = duration.total_seconds()  # Read on every progress update
         self._prerequisites = prerequisites or []
         self._required_resources = required_resources or []
         self._required_tools = required_tools or []
@@ -159,6 +171,14 @@ class Task(ITask):
     def progress(self) -> float:
         return self._progress
     
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @property
+    def chain_id(self) -> Optional[str]:
+        return self._chain_id
+    
     def apply_modifier(self, modifier: IModifier) -> 'Task':
         """Apply a modifier to this task."""
         modified = modifier.modify(self)
@@ -179,8 +199,8 @@ class Task(ITask):
         publish_event(TaskEvent(
             task_id=self.id,
             action="complete",
-            old_status=TaskStatus.IN_PROGRESS.name,
-            new_status=TaskStatus.COMPLETED.name,
+            old_status=_IN_PROGRESS_NAME,
+            new_status=_COMPLETED_NAME,
             progress=1.0
         ))
         
@@ -197,7 +217,7 @@ class Task(ITask):
             rate = modifier.modify(rate)
         
         # Update progress
-        progress_amount = delta_time / self._duration.total_seconds() * rate
+        progress_amount = delta_time / self._duration_seconds * rate
         old_progress = self._progress
         self._progress = min(1.0, self._progress + progress_amount)
         
@@ -214,16 +234,23 @@ class Task(ITask):
             publish_event(TaskEvent(
                 task_id=self.id,
                 action="complete",
-                old_status=TaskStatus.IN_PROGRESS.name,
-                new_status=TaskStatus.COMPLETED.name,
+                old_status=_IN_PROGRESS_NAME,
+                new_status=_COMPLETED_NAME,
                 progress=1.0
             ))
     
+    def update_progress(self, time_passed: timedelta, season: str, weather: str) -> None:
+        """Advance progress by elapsed game time, scaled by the season multiplier."""
+        if self._status != TaskStatus.IN_PROGRESS:
+            return
+        
+        self.update(time_passed.total_seconds() * self._season_multipliers.get(season, 1.0))
+    
     def can_start(
         self,
         current_time: datetime,
         available_resources: Dict[ResourceType, Tuple[float, float]],
-        completed_task_ids: Set[str],
+        completed_task_ids: AbstractSet[str],
         current_skills: Dict[str, float],
         season: str,
         weather: str
@@ -252,10 +279,11 @@ class Task(ITask):
         
         # Check required resources
         for req in self._required_resources:
-            if req.type not in available_resources:
+            available = available_resources.get(req.type)
+            if available is None:
                 return False, f"Missing required resource: {req.type.name}"
             
-            quantity, quality = available_resources[req.type]
+            quantity, quality = available
             if quantity < req.quantity:
                 return False, f"Not enough {req.type.name}: need {req.quantity}, have {quantity}"
             
@@ -264,10 +292,11 @@ class Task(ITask):
         
         # Check required tools
         for tool in self._required_tools:
-            if tool.type not in available_resources:
+            available = available_resources.get(tool.type)
+            if available is None:
                 return False, f"Missing required tool: {tool.type.name}"
             
-            quantity, quality = available_resources[tool.type]
+            quantity, quality = available
             if quantity < tool.quantity:
                 return False, f"Not enough {tool.type.name}: need {tool.quantity}, have {quantity}"
             
@@ -308,8 +337,8 @@ class Task(ITask):
         publish_event(TaskEvent(
             task_id=self.id,
             action="start",
-            old_status=TaskStatus.AVAILABLE.name,
-            new_status=TaskStatus.IN_PROGRESS.name,
+            old_status=_AVAILABLE_NAME,
+            new_status=_IN_PROGRESS_NAME,
             progress=0.0
         ))
     
@@ -323,8 +352,8 @@ class Task(ITask):
         publish_event(TaskEvent(
             task_id=self.id,
             action="fail",
-            old_status=TaskStatus.IN_PROGRESS.name,
-            new_status=TaskStatus.FAILED.name,
+            old_status=_IN_PROGRESS_NAME,
+            new_status=_FAILED_NAME,
             progress=self._progress
         ))
     
@@ -335,7 +364,7 @@ class Task(ITask):
             "name": self._name,
             "description": self._description,
             "type": self._type.name,
-            "duration_seconds": self._duration.total_seconds(),
+            "duration_seconds": self._duration_seconds,
             "prerequisites": [
                 {
                     "task_id": p.task_id,
@@ -380,13 +409,13 @@ class Task(ITask):
                 }
                 for r in self._resource_rewards
             ],
-            "skill_requirements": self._skill_requirements,
-            "skill_rewards": self._skill_rewards,
+            "skill_requirements": dict(self._skill_requirements),
+            "skill_rewards": dict(self._skill_rewards),
             "reputation_reward": self._reputation_reward,
             "village_exp_reward": self._village_exp_reward,
-            "valid_time_ranges": self._valid_time_ranges,
-            "season_multipliers": self._season_multipliers,
-            "weather_requirements": self._weather_requirements,
+            "valid_time_ranges": list(self._valid_time_ranges),
+            "season_multipliers": dict(self._season_multipliers),
+            "weather_requirements": list(self._weather_requirements),
             "status": self._status.name,
             "progress": self._progress,
             "start_time": self._start_time.isoformat() if self._start_time else None,
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
 from datetime import datetime, timedelta
+import itertools
 import logging
 import json
 from pathlib import Path
@@ -8,22 +9,21 @@ import uuid
 
 from .task import Task, TaskType, TaskStatus, ResourceRequirement, ResourceReward
 from .resource_manager import ResourceType
-from .task_template import TaskTemplate, TaskChain
+from .task_template import TaskTemplate, TaskChain, weather_bit
 from .task_template_manager import TaskTemplateManager
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Task.status reports the status name
+_COMPLETED_NAME = TaskStatus.COMPLETED.name
+
 class TaskManager:
     def __init__(self, templates_dir: str = "data/templates"):
         self.active_tasks: Dict[str, Task] = {}
         self.completed_tasks: Dict[str, Task] = {}
         self.failed_tasks: Dict[str, Task] = {}
+        self._completed_ids: Set[str] = set()
+        self._chain_remaining: Dict[str, int] = {}  # Chain ID -> unfinished task count
         self.template_manager = TaskTemplateManager(templates_dir)
         
         logger.info("Task manager initialized")
@@ -32,40 +32,49 @@ class TaskManager:
         self,
         time_passed: timedelta,
         season: str,
-        weather: str
+        weather: str,
+        now: Optional[datetime] = None
     ) -> None:
         """Update all active tasks."""
-        completed_tasks = []
+        now = now or datetime.now()
         
+        # Advance every task first, then move the finished ones out of active_tasks
+        finished = []
         for task_id, task in self.active_tasks.items():
             task.update_progress(time_passed, season, weather)
-            
-            if task.status == TaskStatus.COMPLETED:
-                completed_tasks.append(task_id)
-                self.completed_tasks[task_id] = task
-                logger.info(f"Task completed: {task.name} ({task_id})")
-                
-                # Check if this completes a chain
-                if task.chain_id:
-                    chain = self.template_manager.task_chains.get(task.chain_id)
-                    if chain:
-                        # Check if all tasks in chain are completed
-                        chain_completed = True
-                        for chain_task_id in chain.tasks:
-                            if chain_task_id not in self.completed_tasks:
-                                chain_completed = False
-                                break
-                        
-                        if chain_completed:
-                            self.template_manager.mark_chain_completed(
-                                chain.id,
-                                datetime.now()
-                            )
-                            logger.info(f"Chain completed: {chain.name} ({chain.id})")
-        
-        # Remove completed tasks from active tasks
-        for task_id in completed_tasks:
+            if task.status == _COMPLETED_NAME:
+                finished.append((task_id, task))
+        
+        for task_id, task in finished:
             del self.active_tasks[task_id]
+            newly_completed = task_id not in self._completed_ids
+            self.completed_tasks[task_id] = task
+            self._completed_ids.add(task_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Task completed: %s (%s)", task.name, task_id)
+            
+            # Check if this completes a chain
+            if newly_completed and task.chain_id:
+                chain = self.template_manager.task_chains.get(task.chain_id)
+                if chain and self._count_down_chain(chain) == 0:
+                    del self._chain_remaining[chain.id]
+                    self.template_manager.mark_chain_completed(chain.id, now)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Chain completed: %s (%s)", chain.name, chain.id)
+    
+    def _count_down_chain(self, chain: TaskChain) -> int:
+        """Record one more finished task in a chain and return how many remain."""
+        remaining = self._chain_remaining.get(chain.id)
+        if remaining is None:
+            # First completion seen for this chain: count what is still unfinished
+            remaining = sum(
+                1 for chain_task_id in chain.tasks
+                if chain_task_id not in self._completed_ids
+            )
+        else:
+            remaining -= 1
+        self._chain_remaining[chain.id] = remaining
+        return remaining
     
     def get_available_tasks(
         self,
@@ -79,7 +88,7 @@ class TaskManager:
     ) -> List[Tuple[Task, str]]:
         """Get all tasks that can be started."""
         available_tasks = []
-        completed_task_ids = set(self.completed_tasks.keys())
+        completed_task_ids = self._completed_ids
         
         # Get available chains
         available_chains = self.template_manager.get_available_chains(
@@ -101,7 +110,14 @@ class TaskManager:
             
             for template in chain_tasks:
                 # Skip if task is already active or completed
-                if template.id in self.active_tasks or template.id in self.completed_tasks:
+                if template.id in self.active_tasks or template.id in completed_task_ids:
+                    continue
+                
+                # Hidden tasks are only listed when startable, so drop the
+                # ones that fail the cheap time/weather/resource checks up front
+                if template.is_hidden and self._template_cheap_reject(
+                    template, current_time, weather, available_resources
+                ):
                     continue
                 
                 # Generate task from template
@@ -124,28 +140,54 @@ class TaskManager:
         
         return available_tasks
     
+    def _template_cheap_reject(
+        self,
+        template: TaskTemplate,
+        current_time: datetime,
+        weather: str,
+        available_resources: Dict[ResourceType, Tuple[float, float]]
+    ) -> bool:
+        """Check whether a template fails its weather, time or resource restrictions."""
+        if template.weather_mask and not template.weather_mask & weather_bit(weather):
+            return True
+        if template.valid_time_ranges:
+            current_hour = current_time.hour
+            if not any(
+                start_hour <= current_hour < end_hour
+                for start_hour, end_hour in template.valid_time_ranges
+            ):
+                return True
+        for requirement in itertools.chain(template.required_resources, template.required_tools):
+            quantity, quality = available_resources.get(requirement.type, (0.0, 0.0))
+            if quantity < requirement.quantity or quality < requirement.min_quality:
+                return True
+        return False
+    
     def start_task(
         self,
         task_id: str,
         current_time: datetime
     ) -> Optional[str]:
         """Start a task."""
+        if task_id in self.active_tasks:
+            return "Task already in progress"
+        
         # Find task in available tasks
-        available_tasks = [task for task, _ in self.get_available_tasks(
-            current_time=current_time,
-            available_resources={},  # These will be checked by the task itself
-            current_skills={},
-            season="",
-            weather="",
-            village_level=0,
-            reputation=0.0
-        )]
-        
-        task = None
-        for available_task in available_tasks:
-            if available_task.id == task_id:
-                task = available_task
-                break
+        task = next(
+            (
+                available_task for available_task, _ in self.get_available_tasks(
+                    current_time=current_time,
+                    available_resources={},  # These will be checked by the task itself
+                    current_skills={},
+                    season="",
+                    weather="",
+                    village_level=0,
+                    reputation=0.0
+                )
+                if available_task.id == task_id
+            ),
+            None
+        )
         
         if not task:
             return "Task not found or not available"
@@ -156,25 +198,25 @@ class TaskManager:
         task.progress = 0.0
         
         self.active_tasks[task_id] = task
-        logger.info(f"Started task: {task.name} ({task_id})")
+        logger.info("Started task: %s (%s)", task.name, task_id)
         
         return None
     
     def fail_task(self, task_id: str) -> None:
         """Mark a task as failed."""
-        if task_id in self.active_tasks:
-            task = self.active_tasks[task_id]
-            task.status = TaskStatus.FAILED
-            self.failed_tasks[task_id] = task
-            del self.active_tasks[task_id]
-            logger.info(f"Failed task: {task.name} ({task_id})")
+        task = self.active_tasks.pop(task_id, None)
+        if task is None:
+            return
+        
+        task.status = TaskStatus.FAILED
+        self.failed_tasks[task_id] = task
+        logger.info("Failed task: %s (%s)", task.name, task_id)
     
     def cancel_task(self, task_id: str) -> None:
         """Cancel an active task."""
-        if task_id in self.active_tasks:
-            task = self.active_tasks[task_id]
-            del self.active_tasks[task_id]
-            logger.info(f"Cancelled task: {task.name} ({task_id})")
+        task = self.active_tasks.pop(task_id, None)
+        if task is not None:
+            logger.info("Cancelled task: %s (%s)", task.name, task_id)
     
     def claim_task_rewards(
         self,
@@ -196,38 +238,62 @@ class TaskManager:
     def save_state(self) -> dict:
         """Convert manager state to dictionary for saving."""
         return {
-            "active_tasks": {
-                task_id: task.to_dict()
-                for task_id, task in self.active_tasks.items()
-            },
-            "completed_tasks": {
-                task_id: task.to_dict()
-                for task_id, task in self.completed_tasks.items()
-            },
-            "failed_tasks": {
-                task_id: task.to_dict()
-                for task_id, task in self.failed_tasks.items()
-            },
+            "active_tasks": self._serialize_tasks(self.active_tasks),
+            "completed_tasks": self._serialize_tasks(self.completed_tasks),
+            "failed_tasks": self._serialize_tasks(self.failed_tasks),
             "template_manager": self.template_manager.to_dict()
         }
     
-    def load_state(self, state: dict) -> None:
-        """Load manager state from dictionary."""
-        self.active_tasks = {
-            task_id: Task.from_dict(task_data)
-            for task_id, task_data in state.get("active_tasks", {}).items()
-        }
+    def write_state(self, fp: TextIO) -> None:
+        """Write manager state as JSON, encoding one task at a time.
         
-        self.completed_tasks = {
-            task_id: Task.from_dict(task_data)
-            for task_id, task_data in state.get("completed_tasks", {}).items()
-        }
+        Produces the same document as json.dump(self.save_state(), fp)
+        without building the whole state dictionary first.
+        """
+        for chunk in self._iter_state_json():
+            fp.write(chunk)
+    
+    def _iter_state_json(self) -> Iterator[str]:
+        """Yield the JSON encoding of the manager state in fragments."""
+        encoder = json.JSONEncoder()
+        stores = (
+            ("active_tasks", self.active_tasks),
+            ("completed_tasks", self.completed_tasks),
+            ("failed_tasks", self.failed_tasks)
+        )
         
-        self.failed_tasks = {
-            task_id: Task.from_dict(task_data)
-            for task_id, task_data in state.get("failed_tasks", {}).items()
-        }
+        yield "{"
+        for key, tasks in stores:
+            yield f'"{key}": {{'
+            for index, (task_id, task) in enumerate(tasks.items()):
+                if index:
+                    yield ", "
+                yield encoder.encode(task_id)
+                yield ": "
+                yield from encoder.iterencode(task.to_dict())
+            yield "}, "
+        yield '"template_manager": '
+        yield from encoder.iterencode(self.template_manager.to_dict())
+        yield "}"
+    
+    def load_state(self, state: dict) -> None:
+        """Load manager state from dictionary."""
+        self.active_tasks = self._deserialize_tasks(state.get("active_tasks", {}))
+        self.completed_tasks = self._deserialize_tasks(state.get("completed_tasks", {}))
+        self._completed_ids = set(self.completed_tasks)
+        self._chain_remaining = {}
+        self.failed_tasks = self._deserialize_tasks(state.get("failed_tasks", {}))
         
         self.template_manager.load_state(state.get("template_manager", {}))
         
-        logger.info("Loaded task manager state") 
\ No newline at end of file
+        logger.info("Loaded task manager state")
+    
+    @staticmethod
+    def _serialize_tasks(tasks: Dict[str, Task]) -> dict:
+        """Convert a task store to dictionary for saving."""
+        return {task_id: task.to_dict() for task_id, task in tasks.items()}
+    
+    @staticmethod
+    def _deserialize_tasks(data: dict) -> Dict[str, Task]:
+        """Create a task store from dictionary."""
+        return {task_id: Task.from_dict(task_data) for task_id, task_data in data.items()}
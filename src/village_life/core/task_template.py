@@ -1,24 +1,97 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from datetime import timedelta
-import uuid
 import logging
+import sys
 
-from .task import TaskType, ResourceRequirement, ResourceReward, TaskPrerequisite
+from .task import TaskType, ResourceRequirement, ResourceReward, TaskPrerequisite, generate_id
 from .resource_manager import ResourceType
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Weather name -> bit, allocated as new weather names are seen
+_weather_bits: Dict[str, int] = {}
+
+def weather_bit(weather: str) -> int:
+    """Get the bit for a weather name, or 0 if no template uses it."""
+    return _weather_bits.get(weather, 0)
+
+def _weather_mask(weathers: Iterable[str]) -> int:
+    """Fold weather names into a bitmask, allocating bits for new names."""
+    mask = 0
+    for weather in weathers:
+        bit = _weather_bits.get(weather)
+        if bit is None:
+            bit = _weather_bits[weather] = 1 << len(_weather_bits)
+        mask |= bit
+    return mask
+
+@lru_cache(maxsize=4096)
+def _intern_requirement(
+    resource_type: ResourceType,
+    quantity: float,
+    min_quality: float,
+    consumed: bool
+) -> ResourceRequirement:
+    """Get a shared requirement instance for identical requirement values."""
+    return ResourceRequirement(
+        type=resource_type,
+        quantity=quantity,
+        min_quality=min_quality,
+        consumed=consumed
+    )
+
+@lru_cache(maxsize=4096)
+def _intern_reward(
+    resource_type: ResourceType,
+    base_quantity: float,
+    quality_multiplier: float,
+    skill_multiplier: float,
+    random_bonus: float
+) -> ResourceReward:
+    """Get a shared reward instance for identical reward values."""
+    return ResourceReward(
+        type=resource_type,
+        base_quantity=base_quantity,
+        quality_multiplier=quality_multiplier,
+        skill_multiplier=skill_multiplier,
+        random_bonus=random_bonus
+    )
+
+def _intern_keys(mapping: Dict[str, float]) -> Dict[str, float]:
+    """Copy a dict with its keys (skill, season names) interned."""
+    return {sys.intern(key): value for key, value in mapping.items()}
+
+def _intern_names(names: Iterable[str]) -> List[str]:
+    """Intern a list of ids or names shared across templates."""
+    return [sys.intern(name) for name in names]
+
+def _intern_optional(name: Optional[str]) -> Optional[str]:
+    """Intern an optional id or name."""
+    return sys.intern(name) if name else name
+
+def _decode_prerequisite(data: dict) -> TaskPrerequisite:
+    """Create a prerequisite from dictionary, leaving omitted fields unset."""
+    resource_type = data.get("resource_type")
+    return TaskPrerequisite(
+        task_id=_intern_optional(data.get("task_id")),
+        skill_name=_intern_optional(data.get("skill_name")),
+        skill_level=data.get("skill_level"),
+        building_type=data.get("building_type"),
+        resource_type=ResourceType[resource_type] if resource_type else None,
+        resource_quantity=data.get("resource_quantity"),
+        resource_quality=data.get("resource_quality"),
+        season=_intern_optional(data.get("season")),
+        weather_type=_intern_optional(data.get("weather_type")),
+        time_range=data.get("time_range"),
+        village_level=data.get("village_level")
+    )
+
+@dataclass(slots=True)
 class TaskChain:
     """Represents a sequence of related tasks that form a progression chain."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: generate_id("chain"))
     name: str = ""
     description: str = ""
     prerequisites: List[str] = field(default_factory=list)  # List of required chain IDs
@@ -29,6 +102,14 @@ class TaskChain:
     cooldown: Optional[timedelta] = None
     season_availability: Set[str] = field(default_factory=set)
     weather_availability: Set[str] = field(default_factory=set)
+    prerequisite_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)  # Frozen prerequisites
+    
+    def __post_init__(self):
+        self.prerequisite_set = frozenset(self.prerequisites)
+    
+    def invalidate(self) -> None:
+        """Recompute derived data after the chain is modified."""
+        self.prerequisite_set = frozenset(self.prerequisites)
     
     def to_dict(self) -> dict:
         """Convert chain to dictionary for saving."""
@@ -50,31 +131,31 @@ class TaskChain:
     def from_dict(cls, data: dict) -> 'TaskChain':
         """Create chain from dictionary."""
         return cls(
-            id=data["id"],
+            id=sys.intern(data["id"]),
             name=data["name"],
             description=data["description"],
-            prerequisites=data.get("prerequisites", []),
-            tasks=data.get("tasks", []),
+            prerequisites=_intern_names(data.get("prerequisites", [])),
+            tasks=_intern_names(data.get("tasks", [])),
             village_level_required=data.get("village_level_required", 0),
             reputation_required=data.get("reputation_required", 0.0),
             is_repeatable=data.get("is_repeatable", False),
             cooldown=timedelta(seconds=data["cooldown_seconds"]) if data.get("cooldown_seconds") else None,
-            season_availability=set(data.get("season_availability", [])),
-            weather_availability=set(data.get("weather_availability", []))
+            season_availability=set(_intern_names(data.get("season_availability", []))),
+            weather_availability=set(_intern_names(data.get("weather_availability", [])))
         )
 
-@dataclass
+@dataclass(slots=True)
 class TaskTemplate:
     """Template for generating tasks with consistent properties."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: generate_id("tpl"))
     name: str = ""
     description: str = ""
     type: TaskType = TaskType.GATHERING
     base_duration: timedelta = field(default_factory=lambda: timedelta(minutes=30))
     prerequisites: List[TaskPrerequisite] = field(default_factory=list)
-    required_resources: List[ResourceRequirement] = field(default_factory=list)
-    required_tools: List[ResourceRequirement] = field(default_factory=list)
-    resource_rewards: List[ResourceReward] = field(default_factory=list)
+    required_resources: Tuple[ResourceRequirement, ...] = ()
+    required_tools: Tuple[ResourceRequirement, ...] = ()
+    resource_rewards: Tuple[ResourceReward, ...] = ()
     skill_requirements: Dict[str, float] = field(default_factory=dict)
     skill_rewards: Dict[str, float] = field(default_factory=dict)
     base_reputation_reward: float = 0.0
@@ -87,6 +168,14 @@ class TaskTemplate:
     difficulty_scaling: float = 1.0  # How much requirements scale with village level
     reward_scaling: float = 1.0  # How much rewards scale with difficulty
     is_hidden: bool = False  # Whether task is visible before prerequisites are met
+    weather_mask: int = field(default=0, init=False, repr=False, compare=False)  # Bits of weather_requirements
+    
+    def __post_init__(self):
+        self.weather_mask = _weather_mask(self.weather_requirements or ())
+    
+    def invalidate(self) -> None:
+        """Recompute derived data after the template is modified."""
+        self.weather_mask = _weather_mask(self.weather_requirements or ())
     
     def to_dict(self) -> dict:
         """Convert template to dictionary for saving."""
@@ -157,74 +246,60 @@ class TaskTemplate:
     @classmethod
     def from_dict(cls, data: dict) -> 'TaskTemplate':
         """Create template from dictionary."""
-        prerequisites = [
-            TaskPrerequisite(
-                task_id=p["task_id"],
-                skill_name=p["skill_name"],
-                skill_level=p["skill_level"],
-                building_type=p["building_type"],
-                resource_type=ResourceType[p["resource_type"]] if p["resource_type"] else None,
-                resource_quantity=p["resource_quantity"],
-                resource_quality=p["resource_quality"],
-                season=p["season"],
-                weather_type=p["weather_type"],
-                time_range=p["time_range"],
-                village_level=p["village_level"]
-            )
-            for p in data["prerequisites"]
-        ]
+        prerequisites = [_decode_prerequisite(p) for p in data.get("prerequisites", ())]
         
-        required_resources = [
-            ResourceRequirement(
-                type=ResourceType[r["type"]],
-                quantity=r["quantity"],
-                min_quality=r["min_quality"],
-                consumed=r["consumed"]
+        # Identical requirements and rewards are shared across templates
+        required_resources = tuple(
+            _intern_requirement(
+                ResourceType[r["type"]],
+                r["quantity"],
+                r["min_quality"],
+                r["consumed"]
             )
-            for r in data["required_resources"]
-        ]
+            for r in data.get("required_resources", ())
+        )
         
-        required_tools = [
-            ResourceRequirement(
-                type=ResourceType[t["type"]],
-                quantity=t["quantity"],
-                min_quality=t["min_quality"],
-                consumed=t["consumed"]
+        required_tools = tuple(
+            _intern_requirement(
+                ResourceType[t["type"]],
+                t["quantity"],
+                t["min_quality"],
+                t["consumed"]
             )
-            for t in data["required_tools"]
-        ]
+            for t in data.get("required_tools", ())
+        )
         
-        resource_rewards = [
-            ResourceReward(
-                type=ResourceType[r["type"]],
-                base_quantity=r["base_quantity"],
-                quality_multiplier=r["quality_multiplier"],
-                skill_multiplier=r["skill_multiplier"],
-                random_bonus=r["random_bonus"]
+        resource_rewards = tuple(
+            _intern_reward(
+                ResourceType[r["type"]],
+                r["base_quantity"],
+                r["quality_multiplier"],
+                r["skill_multiplier"],
+                r["random_bonus"]
             )
-            for r in data["resource_rewards"]
-        ]
+            for r in data.get("resource_rewards", ())
+        )
         
         return cls(
-            id=data["id"],
+            id=sys.intern(data["id"]),
             name=data["name"],
-            description=data["description"],
+            description=data.get("description", ""),
             type=TaskType[data["type"]],
             base_duration=timedelta(seconds=data["base_duration_seconds"]),
             prerequisites=prerequisites,
             required_resources=required_resources,
             required_tools=required_tools,
             resource_rewards=resource_rewards,
-            skill_requirements=data["skill_requirements"],
-            skill_rewards=data["skill_rewards"],
-            base_reputation_reward=data["base_reputation_reward"],
-            base_village_exp_reward=data["base_village_exp_reward"],
-            valid_time_ranges=data["valid_time_ranges"],
-            season_multipliers=data["season_multipliers"],
-            weather_requirements=data["weather_requirements"],
-            chain_id=data["chain_id"],
-            position_in_chain=data["position_in_chain"],
-            difficulty_scaling=data["difficulty_scaling"],
-            reward_scaling=data["reward_scaling"],
-            is_hidden=data["is_hidden"]
+            skill_requirements=_intern_keys(data.get("skill_requirements", {})),
+            skill_rewards=_intern_keys(data.get("skill_rewards", {})),
+            base_reputation_reward=data.get("base_reputation_reward", 0.0),
+            base_village_exp_reward=data.get("base_village_exp_reward", 0.0),
+            valid_time_ranges=list(data.get("valid_time_ranges", [])),
+            season_multipliers=_intern_keys(data.get("season_multipliers", {})),
+            weather_requirements=_intern_names(data.get("weather_requirements", [])),
+            chain_id=_intern_optional(data.get("chain_id")),
+            position_in_chain=data.get("position_in_chain", 0),
+            difficulty_scaling=data.get("difficulty_scaling", 1.0),
+            reward_scaling=data.get("reward_scaling", 1.0),
+            is_hidden=data.get("is_hidden", False)
         ) 
\ No newline at end of file
@@ -1,103 +1,260 @@
-from typing import Dict, List, Optional, Set
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
 import json
 import logging
+import mmap
 import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson is missing
+    orjson = None
 
 from .task_template import TaskTemplate, TaskChain
-from .task import Task, TaskStatus
-from .resource_manager import ResourceType
+from .task import Task, ResourceRequirement, ResourceReward
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+def _parse_json(raw: bytes):
+    """Parse a JSON document from bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _read_json(path: str):
+    """Read a JSON document from a file.
+    
+    Parsed documents are reused while the file is unchanged, so managers sharing
+    a templates directory only parse it once. Treat the result as read-only.
+    """
+    stat = os.stat(path)
+    return _read_json_file(path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=4)  # The chain and template files of a couple of directories
+def _read_json_file(path: str, mtime_ns: int, size: int):
+    """Parse a JSON file, cached on its path and the (mtime, size) it was read at."""
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            # orjson parses straight from the mapping, without copying the file into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _parse_json(f.read())
+
+def _write_json(path: str, data) -> None:
+    """Write a JSON document to a file with two-space indentation.
+    
+    The document is written to a temporary file next to the target and moved
+    into place, so a failed save never leaves a truncated file behind.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(data, indent=2).encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 class TaskTemplateManager:
     """Manages task templates and chains, handles task generation."""
     
-    def __init__(self, templates_dir: str = "data/templates"):
-        self.templates_dir = templates_dir
-        self.task_templates: Dict[str, TaskTemplate] = {}
-        self.task_chains: Dict[str, TaskChain] = {}
+    def __init__(self, templates_dir: Optional[str] = "data/templates"):
+        self.templates_dir = templates_dir  # None keeps templates in memory only
+        self._task_templates: Optional[Dict[str, TaskTemplate]] = None  # Loaded on first access
+        self._task_chains: Optional[Dict[str, TaskChain]] = None  # Loaded on first access
         self.completed_chains: Set[str] = set()
-        self.chain_cooldowns: Dict[str, datetime] = {}
+        self.chain_cooldowns: Dict[str, float] = {}  # Chain ID -> POSIX time the cooldown ends
+        self._scaled_cache: Dict[Tuple[str, int], TaskTemplate] = {}  # (Template ID, village level) -> scaled template
+        self._chain_tasks_cache: Dict[Tuple[str, int], Tuple[TaskTemplate, ...]] = {}  # (Chain ID, village level) -> chain tasks
+        self._chain_order: Dict[str, int] = {}  # Chain ID -> position in task_chains
+        self._chains_by_season: Dict[Optional[str], Set[str]] = {}  # Season (None = any) -> chain IDs
+        self._chains_by_weather: Dict[Optional[str], Set[str]] = {}  # Weather (None = any) -> chain IDs
+        self._dirty_chains = False  # Chains changed since last load/save
+        self._dirty_templates = False  # Templates changed since last load/save
         
         # Ensure templates directory exists
-        os.makedirs(templates_dir, exist_ok=True)
+        if templates_dir is not None:
+            os.makedirs(templates_dir, exist_ok=True)
+    
+    @classmethod
+    def from_data(
+        cls,
+        chains_data: List[dict],
+        templates_data: List[dict],
+        templates_dir: Optional[str] = None
+    ) -> 'TaskTemplateManager':
+        """Create a manager from already-parsed chains and templates instead of reading files.
         
-        # Load templates and chains
-        self.load_templates()
-        logger.info(f"Loaded {len(self.task_templates)} task templates and {len(self.task_chains)} task chains")
+        Without a templates directory the manager never touches the filesystem
+        and save_templates does nothing.
+        """
+        manager = cls(templates_dir)
+        manager._task_chains = {}
+        manager._add_chains_data(chains_data)
+        manager._index_chains()
+        manager._task_templates = {}
+        manager._add_templates_data(templates_data)
+        manager._invalidate_caches()
+        return manager
+    
+    @property
+    def task_templates(self) -> Dict[str, TaskTemplate]:
+        """Task templates by ID, loaded from file on first access."""
+        if self._task_templates is None:
+            self._load_task_templates()
+        return self._task_templates
+    
+    @property
+    def task_chains(self) -> Dict[str, TaskChain]:
+        """Task chains by ID, loaded from file on first access."""
+        if self._task_chains is None:
+            self._load_task_chains()
+        return self._task_chains
     
     def load_templates(self) -> None:
         """Load all task templates and chains from files."""
-        # Load task chains first
+        if self.templates_dir is None:
+            return
+        
+        # Read both files concurrently; errors surface in the loaders
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            chains_read = executor.submit(_read_json, os.path.join(self.templates_dir, "task_chains.json"))
+            templates_read = executor.submit(_read_json, os.path.join(self.templates_dir, "task_templates.json"))
+            self._load_task_chains(chains_read)
+            self._load_task_templates(templates_read)
+    
+    def _load_task_chains(self, pending_read: Optional[Future] = None) -> None:
+        """Load task chains from file, or from a read already in progress."""
+        if self._task_chains is None:
+            self._task_chains = {}
+        
         chains_file = os.path.join(self.templates_dir, "task_chains.json")
-        if os.path.exists(chains_file):
+        self._dirty_chains = not os.path.exists(chains_file)
+        if not self._dirty_chains:
             try:
-                with open(chains_file, 'r') as f:
-                    chains_data = json.load(f)
-                for chain_data in chains_data:
-                    chain = TaskChain.from_dict(chain_data)
-                    self.task_chains[chain.id] = chain
-                logger.info(f"Loaded {len(self.task_chains)} task chains")
+                chains_data = pending_read.result() if pending_read is not None else _read_json(chains_file)
             except Exception as e:
                 logger.error(f"Error loading task chains: {e}")
+            else:
+                self._add_chains_data(chains_data)
+        
+        self._index_chains()
+    
+    def _add_chains_data(self, chains_data: List[dict]) -> None:
+        """Build task chains from parsed chain dicts."""
+        try:
+            for chain_data in chains_data:
+                chain = TaskChain.from_dict(chain_data)
+                self._task_chains[chain.id] = chain
+            logger.info("Loaded %d task chains", len(self._task_chains))
+        except Exception as e:
+            logger.error(f"Error loading task chains: {e}")
+    
+    def _load_task_templates(self, pending_read: Optional[Future] = None) -> None:
+        """Load task templates from file, or from a read already in progress."""
+        if self._task_templates is None:
+            self._task_templates = {}
         
-        # Load task templates
         templates_file = os.path.join(self.templates_dir, "task_templates.json")
-        if os.path.exists(templates_file):
+        self._dirty_templates = not os.path.exists(templates_file)
+        if not self._dirty_templates:
             try:
-                with open(templates_file, 'r') as f:
-                    templates_data = json.load(f)
-                for template_data in templates_data:
-                    template = TaskTemplate.from_dict(template_data)
-                    self.task_templates[template.id] = template
-                logger.info(f"Loaded {len(self.task_templates)} task templates")
+                templates_data = pending_read.result() if pending_read is not None else _read_json(templates_file)
             except Exception as e:
                 logger.error(f"Error loading task templates: {e}")
+            else:
+                self._add_templates_data(templates_data)
+        
+        self._invalidate_caches()
     
-    def save_templates(self) -> None:
-        """Save all task templates and chains to files."""
-        # Save task chains
-        chains_file = os.path.join(self.templates_dir, "task_chains.json")
+    def _add_templates_data(self, templates_data: List[dict]) -> None:
+        """Build task templates from parsed template dicts."""
         try:
-            chains_data = [chain.to_dict() for chain in self.task_chains.values()]
-            with open(chains_file, 'w') as f:
-                json.dump(chains_data, f, indent=2)
-            logger.info(f"Saved {len(self.task_chains)} task chains")
+            for template_data in templates_data:
+                template = TaskTemplate.from_dict(template_data)
+                self._task_templates[template.id] = template
+            logger.info("Loaded %d task templates", len(self._task_templates))
         except Exception as e:
-            logger.error(f"Error saving task chains: {e}")
+            logger.error(f"Error loading task templates: {e}")
+    
+    def save_templates(self) -> None:
+        """Save task templates and chains changed since the last load or save."""
+        if self.templates_dir is None:
+            logger.debug("No templates directory, not saving templates")
+            return
+        
+        # Save task chains
+        if self._dirty_chains and self._task_chains is not None:
+            chains_file = os.path.join(self.templates_dir, "task_chains.json")
+            try:
+                chains_data = [chain.to_dict() for chain in self.task_chains.values()]
+                _write_json(chains_file, chains_data)
+                self._dirty_chains = False
+                logger.info("Saved %d task chains", len(self.task_chains))
+            except Exception as e:
+                logger.error(f"Error saving task chains: {e}")
         
         # Save task templates
-        templates_file = os.path.join(self.templates_dir, "task_templates.json")
-        try:
-            templates_data = [template.to_dict() for template in self.task_templates.values()]
-            with open(templates_file, 'w') as f:
-                json.dump(templates_data, f, indent=2)
-            logger.info(f"Saved {len(self.task_templates)} task templates")
-        except Exception as e:
-            logger.error(f"Error saving task templates: {e}")
+        if self._dirty_templates and self._task_templates is not None:
+            templates_file = os.path.join(self.templates_dir, "task_templates.json")
+            try:
+                templates_data = [template.to_dict() for template in self.task_templates.values()]
+                _write_json(templates_file, templates_data)
+                self._dirty_templates = False
+                logger.info("Saved %d task templates", len(self.task_templates))
+            except Exception as e:
+                logger.error(f"Error saving task templates: {e}")
     
     def add_template(self, template: TaskTemplate) -> None:
         """Add a new task template."""
         self.task_templates[template.id] = template
-        logger.info(f"Added task template: {template.name} ({template.id})")
+        self._dirty_templates = True
+        self._invalidate_caches()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Added task template: %s (%s)", template.name, template.id)
+    
+    def _invalidate_caches(self) -> None:
+        """Drop everything derived from the templates."""
+        self._scaled_cache.clear()
+        self._chain_tasks_cache.clear()
+        for template in (self._task_templates or {}).values():
+            template.invalidate()
     
     def add_chain(self, chain: TaskChain) -> None:
         """Add a new task chain."""
+        chain.invalidate()
         self.task_chains[chain.id] = chain
-        logger.info(f"Added task chain: {chain.name} ({chain.id})")
+        self._dirty_chains = True
+        self._index_chains()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Added task chain: %s (%s)", chain.name, chain.id)
+    
+    def _index_chains(self) -> None:
+        """Rebuild the season and weather availability indexes for chains."""
+        self._chain_tasks_cache.clear()
+        self._chain_order = {}
+        self._chains_by_season = {}
+        self._chains_by_weather = {}
+        for position, chain in enumerate(self._task_chains.values()):
+            self._chain_order[chain.id] = position
+            for season in chain.season_availability or (None,):
+                self._chains_by_season.setdefault(season, set()).add(chain.id)
+            for weather in chain.weather_availability or (None,):
+                self._chains_by_weather.setdefault(weather, set()).add(chain.id)
     
     def get_available_chains(
         self,
         village_level: int,
         reputation: float,
-        completed_tasks: Set[str],
+        completed_tasks: AbstractSet[str],
         season: str,
         weather: str,
         current_time: datetime
@@ -105,14 +262,26 @@ class TaskTemplateManager:
         """Get all task chains available to start."""
         available_chains = []
         
-        for chain in self.task_chains.values():
+        task_chains = self.task_chains
+        now_ts = current_time.timestamp()
+        
+        # Only chains available in this season and weather are checked further
+        no_chains = frozenset()
+        candidates = (
+            (self._chains_by_season.get(None, no_chains) | self._chains_by_season.get(season, no_chains))
+            & (self._chains_by_weather.get(None, no_chains) | self._chains_by_weather.get(weather, no_chains))
+        )
+        
+        for chain_id in sorted(candidates, key=self._chain_order.__getitem__):
+            chain = task_chains[chain_id]
+            
             # Skip if chain is completed and not repeatable
             if chain.id in self.completed_chains and not chain.is_repeatable:
                 continue
             
             # Check cooldown
             if chain.id in self.chain_cooldowns:
-                if chain.cooldown and current_time < self.chain_cooldowns[chain.id]:
+                if chain.cooldown and now_ts < self.chain_cooldowns[chain.id]:
                     continue
             
             # Check village level and reputation
@@ -121,20 +290,8 @@ class TaskTemplateManager:
             if reputation < chain.reputation_required:
                 continue
             
-            # Check season and weather availability
-            if chain.season_availability and season not in chain.season_availability:
-                continue
-            if chain.weather_availability and weather not in chain.weather_availability:
-                continue
-            
             # Check prerequisites
-            prerequisites_met = True
-            for prereq_chain_id in chain.prerequisites:
-                if prereq_chain_id not in self.completed_chains:
-                    prerequisites_met = False
-                    break
-            
-            if prerequisites_met:
+            if chain.prerequisite_set <= self.completed_chains:
                 available_chains.append(chain)
         
         return available_chains
@@ -143,30 +300,46 @@ class TaskTemplateManager:
         self,
         chain_id: str,
         village_level: int,
-        completed_tasks: Set[str]
+        completed_tasks: AbstractSet[str]
     ) -> List[TaskTemplate]:
         """Get all tasks in a chain, with difficulty scaled by village level."""
         chain = self.task_chains.get(chain_id)
         if not chain:
             return []
         
-        chain_tasks = []
-        for task_id in chain.tasks:
-            template = self.task_templates.get(task_id)
-            if template:
-                # Scale difficulty based on village level
-                if village_level > 1:
-                    template = self._scale_template_difficulty(template, village_level)
-                chain_tasks.append(template)
+        # completed_tasks does not affect the result, so it is not part of the key
+        key = (chain_id, village_level)
+        chain_tasks = self._chain_tasks_cache.get(key)
+        if chain_tasks is None:
+            task_templates = self.task_templates
+            templates = []
+            for task_id in chain.tasks:
+                template = task_templates.get(task_id)
+                if template:
+                    # Scale difficulty based on village level
+                    if village_level > 1:
+                        template = self._scale_template_difficulty(template, village_level)
+                    templates.append(template)
+            chain_tasks = self._chain_tasks_cache[key] = tuple(templates)
         
-        return chain_tasks
+        return list(chain_tasks)
     
     def _scale_template_difficulty(
         self,
         template: TaskTemplate,
         village_level: int
     ) -> TaskTemplate:
-        """Create a new template with scaled difficulty based on village level."""
+        """Get a template with difficulty scaled for the village level.
+        
+        Scaled templates are cached per village level and shared; treat them as
+        read-only. Collections that scaling leaves unchanged are shared with the
+        source template.
+        """
+        key = (template.id, village_level)
+        scaled = self._scaled_cache.get(key)
+        if scaled is not None:
+            return scaled
+        
         scaling_factor = (village_level - 1) * template.difficulty_scaling
         reward_factor = 1.0 + (scaling_factor * template.reward_scaling)
         
@@ -177,8 +350,8 @@ class TaskTemplateManager:
             description=template.description,
             type=template.type,
             base_duration=template.base_duration,
-            prerequisites=template.prerequisites.copy(),
-            required_resources=[
+            prerequisites=template.prerequisites,
+            required_resources=tuple(
                 ResourceRequirement(
                     type=r.type,
                     quantity=r.quantity * (1.0 + scaling_factor),
@@ -186,8 +359,8 @@ class TaskTemplateManager:
                     consumed=r.consumed
                 )
                 for r in template.required_resources
-            ],
-            required_tools=[
+            ),
+            required_tools=tuple(
                 ResourceRequirement(
                     type=t.type,
                     quantity=t.quantity,
@@ -195,8 +368,8 @@ class TaskTemplateManager:
                     consumed=t.consumed
                 )
                 for t in template.required_tools
-            ],
-            resource_rewards=[
+            ),
+            resource_rewards=tuple(
                 ResourceReward(
                     type=r.type,
                     base_quantity=r.base_quantity * reward_factor,
@@ -205,7 +378,7 @@ class TaskTemplateManager:
                     random_bonus=r.random_bonus
                 )
                 for r in template.resource_rewards
-            ],
+            ),
             skill_requirements={
                 skill: level * (1.0 + scaling_factor * 0.5)
                 for skill, level in template.skill_requirements.items()
@@ -216,9 +389,9 @@ class TaskTemplateManager:
             },
             base_reputation_reward=template.base_reputation_reward * reward_factor,
             base_village_exp_reward=template.base_village_exp_reward * reward_factor,
-            valid_time_ranges=template.valid_time_ranges.copy(),
-            season_multipliers=template.season_multipliers.copy(),
-            weather_requirements=template.weather_requirements.copy(),
+            valid_time_ranges=template.valid_time_ranges,
+            season_multipliers=template.season_multipliers,
+            weather_requirements=template.weather_requirements,
             chain_id=template.chain_id,
             position_in_chain=template.position_in_chain,
             difficulty_scaling=template.difficulty_scaling,
@@ -226,6 +399,7 @@ class TaskTemplateManager:
             is_hidden=template.is_hidden
         )
         
+        self._scaled_cache[key] = scaled
         return scaled
     
     def generate_task(
@@ -233,30 +407,29 @@ class TaskTemplateManager:
         template: TaskTemplate,
         current_time: datetime
     ) -> Task:
-        """Generate a new task instance from a template."""
+        """Generate a new task instance from a template.
+        
+        The template's requirement and reward collections are shared with the
+        task rather than copied; Task.to_dict copies them when saving.
+        """
         return Task(
-            id=template.id,
+            task_id=template.id,
             name=template.name,
             description=template.description,
-            type=template.type,
+            task_type=template.type,
             duration=template.base_duration,
-            prerequisites=template.prerequisites.copy(),
-            required_resources=template.required_resources.copy(),
-            required_tools=template.required_tools.copy(),
-            resource_rewards=template.resource_rewards.copy(),
-            skill_requirements=template.skill_requirements.copy(),
-            skill_rewards=template.skill_rewards.copy(),
+            prerequisites=template.prerequisites,
+            required_resources=template.required_resources,
+            required_tools=template.required_tools,
+            resource_rewards=template.resource_rewards,
+            skill_requirements=template.skill_requirements,
+            skill_rewards=template.skill_rewards,
             reputation_reward=template.base_reputation_reward,
             village_exp_reward=template.base_village_exp_reward,
-            valid_time_ranges=template.valid_time_ranges.copy(),
-            season_multipliers=template.season_multipliers.copy(),
-            weather_requirements=template.weather_requirements.copy(),
-            status=TaskStatus.AVAILABLE,
-            progress=0.0,
-            start_time=None,
-            rewards_claimed=False,
-            chain_id=template.chain_id,
-            event_id=None
+            valid_time_ranges=template.valid_time_ranges,
+            season_multipliers=template.season_multipliers,
+            weather_requirements=template.weather_requirements,
+            chain_id=template.chain_id
         )
     
     def mark_chain_completed(
@@ -269,24 +442,24 @@ class TaskTemplateManager:
         if chain:
             self.completed_chains.add(chain_id)
             if chain.is_repeatable and chain.cooldown:
-                self.chain_cooldowns[chain_id] = current_time + chain.cooldown
-            logger.info(f"Marked chain as completed: {chain.name} ({chain_id})")
+                self.chain_cooldowns[chain_id] = (current_time + chain.cooldown).timestamp()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Marked chain as completed: %s (%s)", chain.name, chain_id)
     
     def to_dict(self) -> dict:
         """Convert manager state to dictionary for saving."""
         return {
             "completed_chains": list(self.completed_chains),
-            "chain_cooldowns": {
-                chain_id: cooldown.isoformat()
-                for chain_id, cooldown in self.chain_cooldowns.items()
-            }
+            "chain_cooldowns": dict(self.chain_cooldowns)
         }
     
     def load_state(self, data: dict) -> None:
         """Load manager state from dictionary."""
+        self._invalidate_caches()
         self.completed_chains = set(data.get("completed_chains", []))
         self.chain_cooldowns = {
-            chain_id: datetime.fromisoformat(cooldown_str)
-            for chain_id, cooldown_str in data.get("chain_cooldowns", {}).items()
+            # Older saves store cooldowns as ISO strings
+            chain_id: datetime.fromisoformat(cooldown).timestamp() if isinstance(cooldown, str) else float(cooldown)
+            for chain_id, cooldown in data.get("chain_cooldowns", {}).items()
         }
         logger.info("Loaded task template manager state") 
\ No newline at end of file
@@ -4,12 +4,6 @@ from enum import Enum, auto
 from typing import Dict, List, Optional, Tuple
 import logging
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class Season(Enum):
@@ -114,12 +108,7 @@ class TimeManager:
         
         # Check if we should do a fixed update
         if self.accumulator >= self.fixed_time_step:
-            # Calculate game minutes passed
-            real_seconds = self.fixed_time_step
-            game_minutes = int(real_seconds * self.time_scale)
-            
-            # Update game date
-            self.game_date.advance(game_minutes)
+            self.step()
             
             # Consume time step
             self.accumulator -= self.fixed_time_step
@@ -130,6 +119,15 @@ class TimeManager:
             
         return False
     
+    def step(self) -> None:
+        """Advance the game date by one fixed time step."""
+        # Calculate game minutes passed
+        real_seconds = self.fixed_time_step
+        game_minutes = int(real_seconds * self.time_scale)
+        
+        # Update game date
+        self.game_date.advance(game_minutes)
+    
     def get_time_of_day(self) -> str:
         """Get the current time of day description."""
         hour = self.game_date.hour
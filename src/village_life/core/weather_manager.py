@@ -15,12 +15,6 @@ from .abstractions.base import IWeather, IModifier
 from .event_system import publish_event, WeatherEvent
 from .modifiers import create_modifier
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class WeatherType(Enum):
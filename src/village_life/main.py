@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import logging
+import os
 import sys
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
@@ -7,6 +9,14 @@ from village_life.ui.game_window import GameWindow
 
 def main():
     """Main entry point for the game."""
+    # Set up logging; debug output only when VILLAGE_LIFE_DEBUG is set
+    level = logging.DEBUG if os.environ.get("VILLAGE_LIFE_DEBUG") else logging.INFO
+    logging.basicConfig(
+        filename='game.log',
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Create necessary directories
     Path("saves").mkdir(exist_ok=True)
     Path("config").mkdir(exist_ok=True)
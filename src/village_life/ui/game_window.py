@@ -18,12 +18,18 @@ class AsciiMenu:
         self.items = items
         self.width = width
         self.selected = 0
+        self._render_cache: Optional[Tuple[tuple, str]] = None  # (render inputs, output) of last render
         
     def render(self, offset_x: int = 0, offset_y: int = 0, alpha: float = 1.0) -> str:
         """Render the menu as ASCII art with offset and alpha."""
         if not self.items:
             return "╔═══ Empty Menu ═══╗\n║     No items     ║\n╚═════════════════╝"
         
+        # Idle redraws render the same menu again; reuse the last output
+        key = (self.selected, tuple(self.items), self.width, offset_x, offset_y, alpha)
+        if self._render_cache is not None and self._render_cache[0] == key:
+            return self._render_cache[1]
+        
         lines = []
         # Top border
         lines.append(" " * offset_x + "╔" + "═" * (self.width - 2) + "╗")
@@ -49,7 +55,9 @@ class AsciiMenu:
             opacity = int(alpha * 255)
             lines = [f"\033[38;2;{opacity};{opacity};{opacity}m{line}\033[0m" for line in lines]
         
-        return "\n".join(lines)
+        rendered = "\n".join(lines)
+        self._render_cache = (key, rendered)
+        return rendered
     
     def move_up(self) -> None:
         """Move selection up, wrapping around to bottom if at top."""
@@ -61,6 +69,13 @@ class AsciiMenu:
         if self.items:  # Only move if there are items
             self.selected = (self.selected + 1) % len(self.items)
     
+    def select_by_name(self, name: str) -> None:
+        """Select the item with the given name, leaving the selection unchanged if absent."""
+        try:
+            self.selected = self.items.index(name)
+        except ValueError:
+            pass
+    
     def get_selected(self) -> Optional[str]:
         """Get the currently selected item."""
         if not self.items:
@@ -9,12 +9,6 @@ from PyQt6.QtGui import QKeyEvent, QFont
 from village_life.core.game import Game
 from village_life.ai import NPC, DialogueType
 
-# Set up logging
-logging.basicConfig(
-    filename='game.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 @dataclass
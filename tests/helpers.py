@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.ai import (
     AIManager,
@@ -12,6 +12,9 @@ from src.ai import (
     NPCSchedule
 )
 
+# Test dialogue by (NPC ID, speaker name), shared by every mock instance
+_dialogue_cache: Dict[Tuple[str, str], str] = {}
+
 class MockAIManager(AIManager):
     """Mock AI manager for testing."""
     
@@ -59,7 +62,11 @@ class MockAIManager(AIManager):
         context: dict
     ) -> str:
         """Generate test dialogue."""
-        return f"Hello! I'm {context.get('name', 'a test NPC')}."
+        name = context.get('name', 'a test NPC')
+        dialogue = _dialogue_cache.get((npc_id, name))
+        if dialogue is None:
+            dialogue = _dialogue_cache[(npc_id, name)] = f"Hello! I'm {name}."
+        return dialogue
     
     async def update_npc_memory(
         self,
@@ -87,6 +87,8 @@ class TestEventBus(unittest.TestCase):
 
 class MockResource(IResource):
     """Mock implementation of IResource for testing."""
+    __slots__ = ('_id', '_quantity', '_quality')
+    
     def __init__(self, id_: str = "test_id"):
         self._id = id_
         self._quantity = 1.0
@@ -136,6 +138,8 @@ class MockResource(IResource):
 
 class MockTask(ITask):
     """Mock implementation of ITask for testing."""
+    __slots__ = ('_id', '_status', '_progress')
+    
     def __init__(self, id_: str = "test_id"):
         self._id = id_
         self._status = "available"
@@ -167,6 +171,8 @@ class MockTask(ITask):
 
 class MockWeather(IWeather):
     """Mock implementation of IWeather for testing."""
+    __slots__ = ('_type', '_intensity')
+    
     def __init__(self, type_: str = "clear", intensity: float = 1.0):
         self._type = type_
         self._intensity = intensity
@@ -191,6 +197,8 @@ class MockWeather(IWeather):
 
 class MockModifier(IModifier):
     """Mock implementation of IModifier for testing."""
+    __slots__ = ('_multiplier',)
+    
     def __init__(self, multiplier: float = 1.0):
         self._multiplier = multiplier
     
@@ -76,11 +76,11 @@ async def test_save_load_system(game, test_save_dir):
     """Test saving and loading game state with NPCs."""
     # Generate NPCs and create some interactions
     await game.generate_initial_npcs(2)
-    npc_ids = list(game.npcs.keys())
+    npc_id = next(iter(game.npcs))
     
     # Start a conversation
-    await game.start_conversation(npc_ids[0])
-    await game.continue_conversation(npc_ids[0], "Hello!")
+    await game.start_conversation(npc_id)
+    await game.continue_conversation(npc_id, "Hello!")
     
     # Save game
     game.save_game("test_save")
@@ -111,14 +111,14 @@ async def test_save_load_system(game, test_save_dir):
         assert new_npc.relationships == npc.relationships
         
         # Check schedule
-        assert vars(new_npc.schedule) == vars(npc.schedule)
+        assert new_npc.schedule == npc.schedule
 
 @pytest.mark.asyncio
 async def test_npc_schedule(game):
     """Test NPC schedule and activity tracking."""
     # Generate an NPC
     await game.generate_initial_npcs(1)
-    npc = list(game.npcs.values())[0]
+    npc = next(iter(game.npcs.values()))
     
     # Test different times
     test_times = [
@@ -130,15 +130,13 @@ async def test_npc_schedule(game):
         (22, "sleep")
     ]
     
+    base = datetime.now()
     for hour, expected_activity in test_times:
-        time = datetime.now().replace(hour=hour)
-        activity = npc.get_current_activity(time)
+        activity = npc.get_current_activity(base.replace(hour=hour))
         assert activity == expected_activity
     
     # Test weekly events
-    monday = datetime.now()
-    while monday.strftime("%A") != "Monday":
-        monday += timedelta(days=1)
+    monday = base + timedelta(days=(7 - base.weekday()) % 7)
     
     activity = npc.get_current_activity(monday)
     assert "market day" in activity.lower()
@@ -148,8 +146,7 @@ async def test_dialogue_context(game):
     """Test dialogue context and response generation."""
     # Generate an NPC
     await game.generate_initial_npcs(1)
-    npc_id = list(game.npcs.keys())[0]
-    npc = game.npcs[npc_id]
+    npc_id, npc = next(iter(game.npcs.items()))
     
     # Start conversation
     response1 = await game.start_conversation(npc_id)
@@ -184,7 +181,7 @@ async def test_error_handling(game):
     
     # Generate an NPC
     await game.generate_initial_npcs(1)
-    npc_id = list(game.npcs.keys())[0]
+    npc_id = next(iter(game.npcs))
     
     # Test empty input
     response = await game.continue_conversation(npc_id, "")
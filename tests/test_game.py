@@ -1,4 +1,6 @@
 import pytest
+import gzip
+import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -76,6 +78,36 @@ def test_save_load_game(game, test_save_dir):
     assert len(new_game.active_tasks) == len(game.active_tasks)
     assert new_game.active_tasks[0].name == game.active_tasks[0].name
 
+def test_save_file_format(game, test_save_dir):
+    """Test that saves are gzip-compressed JSON with a matching extension."""
+    game.save_game("test_save")
+    
+    save_path = test_save_dir / "test_save.json.gz"
+    assert save_path.exists()
+    assert not (test_save_dir / "test_save.json").exists()
+    with gzip.open(save_path, 'rb') as f:
+        assert json.loads(f.read())["character"]["name"] == "Test Player"
+
+def test_save_rewrites_changed_file(game, test_save_dir):
+    """Test that an unchanged state is saved again if the file was replaced."""
+    game.save_game("test_save")
+    save_path = test_save_dir / "test_save.json.gz"
+    save_path.write_bytes(b"edited elsewhere")
+    
+    game.save_game("test_save")
+    with gzip.open(save_path, 'rb') as f:
+        assert json.loads(f.read())["character"]["name"] == "Test Player"
+
+def test_load_plain_json_save(game, test_save_dir):
+    """Test loading a save written as plain JSON by older versions."""
+    game.save_game("test_save")
+    with gzip.open(test_save_dir / "test_save.json.gz", 'rb') as f:
+        (test_save_dir / "old_save.json").write_bytes(f.read())
+    
+    new_game = Game(save_dir=test_save_dir)
+    assert new_game.load_game("old_save")
+    assert new_game.character.name == "Test Player"
+
 def test_game_time(game):
     """Test game time management."""
     # Test time update
@@ -89,4 +121,13 @@ def test_game_time(game):
     interpolated = game.get_interpolated_state()
     assert isinstance(interpolated, dict)
     assert "stats" in interpolated
-    assert "skills" in interpolated 
\ No newline at end of file
+    assert "skills" in interpolated 
+
+def test_tick_updates_weather(game):
+    """Test that fixed steps advance the weather shown in the game state."""
+    assert game.get_current_state()["weather"] == {}
+    
+    game.tick(1)
+    weather = game.get_current_state()["weather"]
+    assert weather["type"] == game.weather_manager.get_current_weather().type
+    assert 0.5 <= weather["intensity"] <= 1.0
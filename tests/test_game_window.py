@@ -45,13 +45,13 @@ def test_menu_navigation(game_window, qtbot):
     # Test down navigation
     initial_selected = game_window.menus["main"].get_selected()
     qtbot.keyClick(game_window, Qt.Key.Key_Down)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.menus["main"].get_selected() != initial_selected, timeout=500)
     after_down = game_window.menus["main"].get_selected()
     assert after_down != initial_selected
     
     # Test up navigation
     qtbot.keyClick(game_window, Qt.Key.Key_Up)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.menus["main"].get_selected() == initial_selected, timeout=500)
     after_up = game_window.menus["main"].get_selected()
     assert after_up == initial_selected
 
@@ -61,12 +61,12 @@ def test_help_toggle(game_window, qtbot):
     
     # Toggle help on
     qtbot.keyClick(game_window, Qt.Key.Key_H)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.show_help, timeout=500)
     assert game_window.show_help
     
     # Toggle help off
     qtbot.keyClick(game_window, Qt.Key.Key_H)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: not game_window.show_help, timeout=500)
     assert not game_window.show_help
 
 def test_menu_transitions(game_window, qtbot):
@@ -74,11 +74,11 @@ def test_menu_transitions(game_window, qtbot):
     # Test direct menu changes
     game_window.current_menu = "main"
     game_window.change_menu("character_creation")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.current_menu == "character_creation", timeout=500)
     assert game_window.current_menu == "character_creation"
     
     game_window.change_menu("main")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.current_menu == "main", timeout=500)
     assert game_window.current_menu == "main"
 
 def test_menu_state_persistence(game_window, qtbot):
@@ -86,7 +86,7 @@ def test_menu_state_persistence(game_window, qtbot):
     # Navigate to feedback menu
     game_window.current_menu = "main"
     game_window.change_menu("feedback")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.current_menu == "feedback", timeout=500)
     
     # Select an option
     initial_selection = game_window.menus["feedback"].get_selected()
@@ -96,12 +96,12 @@ def test_menu_state_persistence(game_window, qtbot):
     
     # Return to main menu and back
     game_window.change_menu("main")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.current_menu == "main", timeout=500)
     assert game_window.current_menu == "main"
     
     # Go back to feedback menu
     game_window.change_menu("feedback")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.current_menu == "feedback", timeout=500)
     
     # Verify selection was preserved
     assert game_window.menus["feedback"].get_selected() == new_selection
@@ -148,12 +148,12 @@ def test_input_handling(game_window, qtbot):
     
     # Type name
     qtbot.keyClicks(game_window, "TestChar")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.input_buffer == "TestChar", timeout=500)
     assert game_window.input_buffer == "TestChar"
     
     # Submit name
     qtbot.keyClick(game_window, Qt.Key.Key_Return)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.game.character is not None, timeout=500)
     assert game_window.game.character is not None
     assert game_window.game.character.name == "TestChar"
 
@@ -168,13 +168,13 @@ def test_task_management(game_window, qtbot):
     game_window.input_prompt = "Enter task name:"
     qtbot.keyClicks(game_window, "Test Task")
     qtbot.keyClick(game_window, Qt.Key.Key_Return)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.new_task["name"] == "Test Task", timeout=500)
     assert game_window.new_task["name"] == "Test Task"
     
     # Test task type cycling
     initial_type = game_window.new_task["type"]
     qtbot.keyClick(game_window, Qt.Key.Key_Tab)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.new_task["type"] != initial_type, timeout=500)
     assert game_window.new_task["type"] != initial_type
 
 def test_game_state_management(game_window, qtbot, tmp_path):
@@ -188,10 +188,9 @@ def test_game_state_management(game_window, qtbot, tmp_path):
     
     # Test save game
     save_menu = game_window.menus["game"]
-    while save_menu.get_selected() != "Save Game":
-        save_menu.move_down()
+    save_menu.select_by_name("Save Game")
     qtbot.keyClick(game_window, Qt.Key.Key_Return)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.game.save_file.exists(), timeout=500)
     assert game_window.game.save_file.exists()
 
 def test_display_updates(game_window, qtbot):
@@ -200,7 +199,7 @@ def test_display_updates(game_window, qtbot):
     
     # Change menu
     game_window.change_menu("character_creation")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.display.toPlainText() != initial_text, timeout=500)
     new_text = game_window.display.toPlainText()
     assert new_text != initial_text
     
@@ -216,7 +215,7 @@ def test_effect_manager(game_window, qtbot):
     # Test menu change effect
     initial_effects = len(game_window.effect_manager._effects)
     game_window.change_menu("character_creation")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: len(game_window.effect_manager._effects) > initial_effects, timeout=500)
     assert len(game_window.effect_manager._effects) > initial_effects
 
 def test_cursor_blinking(game_window, qtbot):
@@ -225,7 +224,7 @@ def test_cursor_blinking(game_window, qtbot):
     initial_cursor = game_window.cursor_visible
     
     # Wait for cursor blink
-    qtbot.wait(600)  # Cursor blinks every 500ms
+    qtbot.waitUntil(lambda: game_window.cursor_visible != initial_cursor, timeout=1000)  # Cursor blinks every 500ms
     assert game_window.cursor_visible != initial_cursor 
 
 def test_game_loading(game_window, qtbot, tmp_path):
@@ -245,10 +244,9 @@ def test_game_loading(game_window, qtbot, tmp_path):
     # Test loading
     game_window.current_menu = "main"
     load_menu = game_window.menus["main"]
-    while load_menu.get_selected() != "Load Game":
-        load_menu.move_down()
+    load_menu.select_by_name("Load Game")
     qtbot.keyClick(game_window, Qt.Key.Key_Return)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.game.character is not None, timeout=500)
     
     assert game_window.game.character is not None
     assert game_window.game.character.name == "TestChar"
@@ -274,17 +272,16 @@ def test_task_completion_and_rewards(game_window, qtbot):
     
     # Create task
     create_menu = game_window.menus["task_creation"]
-    while create_menu.get_selected() != "Create Task":
-        create_menu.move_down()
+    create_menu.select_by_name("Create Task")
     qtbot.keyClick(game_window, Qt.Key.Key_Return)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: len(game_window.game.active_tasks) == 1, timeout=500)
     
     # Verify task was created
     assert len(game_window.game.active_tasks) == 1
     
     # Complete task
     game_window.complete_task()
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: len(game_window.game.active_tasks) == 0, timeout=500)
     
     # Verify task completion
     assert len(game_window.game.active_tasks) == 0
@@ -297,7 +294,7 @@ def test_npc_interactions(game_window, qtbot):
     
     # Navigate to NPC menu
     game_window.change_menu("npcs")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.current_menu == "npcs", timeout=500)
     assert game_window.current_menu == "npcs"
     
     # Test NPC menu options
@@ -306,10 +303,9 @@ def test_npc_interactions(game_window, qtbot):
     assert "Generate NPCs" in npc_menu.items
     
     # Test NPC view
-    while npc_menu.get_selected() != "View NPCs":
-        npc_menu.move_down()
+    npc_menu.select_by_name("View NPCs")
     qtbot.keyClick(game_window, Qt.Key.Key_Return)
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.npc_menu.isVisible(), timeout=500)
     
     # Verify NPC menu is shown
     assert game_window.npc_menu.isVisible()
@@ -334,7 +330,7 @@ def test_resource_management(game_window, qtbot):
     # Complete task to generate resources
     game_window.handle_menu_selection()
     game_window.complete_task()
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.game.get_current_state().get("resources", {}) != initial_resources, timeout=500)
     
     # Verify resources were added
     new_state = game_window.game.get_current_state()
@@ -361,7 +357,7 @@ def test_time_management(game_window, qtbot):
     # Complete task to advance time
     game_window.handle_menu_selection()
     game_window.complete_task()
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.game.get_current_state().get("time", {}) != initial_time, timeout=500)
     
     # Verify time advanced
     new_state = game_window.game.get_current_state()
@@ -378,9 +374,8 @@ def test_weather_effects(game_window, qtbot):
     initial_weather = initial_state.get("weather", {"type": "CLEAR", "intensity": 1.0})
     
     # Update game multiple times to trigger weather change
-    for _ in range(100):  # Increase updates to ensure weather change
-        game_window.update_game()
-        qtbot.wait(10)
+    game_window.game.tick(100)  # Increase updates to ensure weather change
+    QApplication.processEvents()
     
     # Verify weather state changed
     new_state = game_window.game.get_current_state()
@@ -400,8 +395,7 @@ def test_error_handling(game_window, qtbot):
     
     # Attempt to create invalid task
     create_menu = game_window.menus["task_creation"]
-    while create_menu.get_selected() != "Create Task":
-        create_menu.move_down()
+    create_menu.select_by_name("Create Task")
     qtbot.keyClick(game_window, Qt.Key.Key_Return)
     qtbot.wait(100)
     
@@ -444,12 +438,12 @@ def test_ui_responsiveness(game_window, qtbot):
     # Verify UI is still responsive
     initial_menu = game_window.current_menu
     game_window.change_menu("main")
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.current_menu == "main", timeout=500)
     assert game_window.current_menu == "main"
     
     # Test display updates during task
     initial_display = game_window.display.toPlainText()
     game_window.update_game()
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: game_window.display.toPlainText() != initial_display, timeout=500)
     new_display = game_window.display.toPlainText()
     assert new_display != initial_display 
\ No newline at end of file
@@ -3,9 +3,8 @@ Tests for the modifier system.
 """
 
 import unittest
-from datetime import datetime, timedelta
-from typing import Any, Dict
-from unittest.mock import Mock, patch
+from typing import Any
+from types import SimpleNamespace
 
 from src.core.modifiers import (
     BaseModifier, MultiplyModifier, AddModifier,
@@ -13,36 +12,50 @@ from src.core.modifiers import (
     ModifierRegistry, create_modifier, register_modifier
 )
 
+class _DummyModifier(BaseModifier):
+    """Minimal concrete modifier that returns its target unchanged."""
+    def modify(self, target: Any) -> Any:
+        return target
+
+class _OtherModifier(BaseModifier):
+    """Second concrete modifier, for combining mismatched types."""
+    def modify(self, target: Any) -> Any:
+        return target
+
+class _WeatherStub:
+    """Target that records apply_weather calls."""
+    def __init__(self):
+        self.calls = []
+    
+    def apply_weather(self, weather_type: str, intensity: float) -> None:
+        self.calls.append((weather_type, intensity))
+
+class _TimeStub:
+    """Target that records apply_time_effect calls."""
+    def __init__(self):
+        self.calls = []
+    
+    def apply_time_effect(self, day_phase: str, time_factor: float) -> None:
+        self.calls.append((day_phase, time_factor))
+
 class TestBaseModifier(unittest.TestCase):
     """Test the BaseModifier class."""
     def test_base_modifier_creation(self):
         """Test creating a base modifier."""
-        class TestModifier(BaseModifier):
-            def modify(self, target: Any) -> Any:
-                return target
-        
-        modifier = TestModifier("test", 1.0)
+        modifier = _DummyModifier("test", 1.0)
         self.assertEqual(modifier.type, "test")
         self.assertEqual(modifier.strength, 1.0)
     
     def test_base_modifier_combine(self):
         """Test combining base modifiers."""
-        class TestModifier(BaseModifier):
-            def modify(self, target: Any) -> Any:
-                return target
-        
-        mod1 = TestModifier("test", 1.0)
-        mod2 = TestModifier("test", 2.0)
+        mod1 = _DummyModifier("test", 1.0)
+        mod2 = _DummyModifier("test", 2.0)
         combined = mod1.combine(mod2)
         
         self.assertEqual(combined.strength, 3.0)
         
         # Test combining different types
-        class OtherModifier(BaseModifier):
-            def modify(self, target: Any) -> Any:
-                return target
-        
-        other = OtherModifier("test", 1.0)
+        other = _OtherModifier("test", 1.0)
         with self.assertRaises(ValueError):
             mod1.combine(other)
 
@@ -82,9 +95,8 @@ class TestQualityModifier(unittest.TestCase):
         """Test quality modifier functionality."""
         modifier = QualityModifier("quality", 0.5)
         
-        # Test with mock resource
-        resource = Mock()
-        resource.quality = 1.0
+        # Test with stub resource
+        resource = SimpleNamespace(quality=1.0)
         
         modified = modifier.modify(resource)
         self.assertEqual(modified.quality, 0.5)
@@ -104,15 +116,14 @@ class TestWeatherModifier(unittest.TestCase):
         """Test weather modifier functionality."""
         modifier = WeatherModifier("rainy", 0.8)
         
-        # Test with mock target
-        target = Mock()
-        target.apply_weather = Mock()
+        # Test with stub target
+        target = _WeatherStub()
         
         modifier.modify(target)
-        target.apply_weather.assert_called_once_with("rainy", 0.8)
+        self.assertEqual(target.calls, [("rainy", 0.8)])
         
         # Test with target without weather support
-        other_target = Mock()
+        other_target = SimpleNamespace()
         modified = modifier.modify(other_target)
         self.assertEqual(modified, other_target)
 
@@ -122,15 +133,14 @@ class TestTimeModifier(unittest.TestCase):
         """Test time modifier functionality."""
         modifier = TimeModifier(0.5, "night")
         
-        # Test with mock target
-        target = Mock()
-        target.apply_time_effect = Mock()
+        # Test with stub target
+        target = _TimeStub()
         
         modifier.modify(target)
-        target.apply_time_effect.assert_called_once_with("night", 0.5)
+        self.assertEqual(target.calls, [("night", 0.5)])
         
         # Test with target without time support
-        other_target = Mock()
+        other_target = SimpleNamespace()
         modified = modifier.modify(other_target)
         self.assertEqual(modified, other_target)
 
@@ -141,11 +151,7 @@ class TestModifierRegistry(unittest.TestCase):
     
     def test_register_modifier(self):
         """Test registering modifiers."""
-        class TestModifier(BaseModifier):
-            def modify(self, target: Any) -> Any:
-                return target
-        
-        self.registry.register_modifier("test", TestModifier)
+        self.registry.register_modifier("test", _DummyModifier)
         self.assertIn("test", self.registry.get_available_modifiers())
     
     def test_create_modifier(self):
@@ -170,13 +176,9 @@ class TestModifierFunctions(unittest.TestCase):
     
     def test_register_modifier(self):
         """Test registering modifiers using global function."""
-        class TestModifier(BaseModifier):
-            def modify(self, target: Any) -> Any:
-                return target
-        
-        register_modifier("test", TestModifier)
+        register_modifier("test", _DummyModifier)
         modifier = create_modifier("test")
-        self.assertIsInstance(modifier, TestModifier)
+        self.assertIsInstance(modifier, _DummyModifier)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
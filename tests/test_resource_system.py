@@ -129,6 +129,18 @@ class TestResource(unittest.TestCase):
         # Test invalid split
         with self.assertRaises(ValueError):
             self.resource.split(20.0)
+    
+    def test_resource_decay(self):
+        """Test decaying a resource stack in place."""
+        self.assertEqual(self.resource.decay(4.0), 6.0)
+        self.assertEqual(self.resource.quantity, 6.0)
+        
+        # Decay never leaves a negative stack
+        self.assertEqual(self.resource.decay(10.0), 0.0)
+        
+        # Test invalid decay
+        with self.assertRaises(ValueError):
+            self.resource.decay(-1.0)
 
 class TestResourceManager(unittest.TestCase):
     """Test the ResourceManager class."""
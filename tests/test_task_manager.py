@@ -1,6 +1,9 @@
 import pytest
+import io
+import json
 from datetime import datetime, timedelta
 from src.core.task_manager import TaskManager, TaskChain
+from src.core.task_template_manager import TaskTemplateManager
 from src.core.task import TaskType, TaskStatus, ResourceRequirement, ResourceReward
 from src.core.resource_manager import ResourceType
 
@@ -214,4 +217,76 @@ def test_save_load_state(task_manager, sample_skills, sample_resources):
     new_chain = next(iter(new_manager.task_chains.values()))
     assert new_chain.name == chain.name
     assert len(new_chain.tasks) == len(chain.tasks)
-    assert new_chain.tasks[0].status == TaskStatus.COMPLETED 
\ No newline at end of file
+    assert new_chain.tasks[0].status == TaskStatus.COMPLETED 
+
+@pytest.fixture
+def scouting_manager():
+    """Task manager with a two-step chain whose second step is hidden."""
+    task_manager = TaskManager()
+    task_manager.template_manager = TaskTemplateManager.from_data(
+        [{
+            "id": "scouting",
+            "name": "Scouting",
+            "description": "Scout the area",
+            "tasks": ["scout_area", "find_cave"]
+        }],
+        [
+            {
+                "id": "scout_area",
+                "name": "Scout Area",
+                "type": "EXPEDITION",
+                "base_duration_seconds": 1800
+            },
+            {
+                "id": "find_cave",
+                "name": "Find Cave",
+                "type": "EXPEDITION",
+                "base_duration_seconds": 1800,
+                "is_hidden": True
+            }
+        ]
+    )
+    return task_manager
+
+def _scouting_tasks(task_manager, sample_skills, sample_resources):
+    """List the available scouting tasks at a fixed time."""
+    return task_manager.get_available_tasks(
+        current_time=datetime(2024, 6, 1, 12, 0),
+        available_resources=sample_resources,
+        current_skills=sample_skills,
+        season="SUMMER",
+        weather="CLEAR",
+        village_level=1,
+        reputation=0.0
+    )
+
+def test_hidden_task_listed_when_startable(scouting_manager, sample_skills, sample_resources):
+    """Test that a startable hidden task is listed even after an unfinished task."""
+    available_tasks = _scouting_tasks(scouting_manager, sample_skills, sample_resources)
+    
+    assert [(task.id, status) for task, status in available_tasks] == [
+        ("scout_area", "Ready to start"),
+        ("find_cave", "Ready to start")
+    ]
+
+def test_available_tasks_are_fresh(scouting_manager, sample_skills, sample_resources):
+    """Test that changing a listed task does not affect later listings."""
+    first_task, _ = _scouting_tasks(scouting_manager, sample_skills, sample_resources)[0]
+    first_task.start(datetime(2024, 6, 1, 12, 0))
+    
+    task, status = _scouting_tasks(scouting_manager, sample_skills, sample_resources)[0]
+    assert task is not first_task
+    assert task.status == TaskStatus.AVAILABLE.name
+    assert status == "Ready to start"
+
+def test_write_state_matches_save_state(scouting_manager, sample_skills, sample_resources):
+    """Test that the streamed state decodes to the saved state."""
+    scout_task, find_task = [task for task, _ in _scouting_tasks(scouting_manager, sample_skills, sample_resources)]
+    scout_task.start(datetime(2024, 6, 1, 12, 0))
+    scouting_manager.active_tasks[scout_task.id] = scout_task
+    scouting_manager.completed_tasks[find_task.id] = find_task
+    
+    fp = io.StringIO()
+    scouting_manager.write_state(fp)
+    
+    assert json.loads(fp.getvalue()) == scouting_manager.save_state()
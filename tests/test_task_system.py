@@ -287,6 +287,16 @@ class TestTask(unittest.TestCase):
         self.assertEqual(new_task._skill_rewards, self.task._skill_rewards)
         self.assertEqual(new_task._status, self.task._status)
         self.assertEqual(new_task.progress, self.task.progress)
+    
+    def test_serialization_not_shared(self):
+        """Test that changing a serialized task does not affect later saves."""
+        data = self.task.to_dict()
+        data["prerequisites"].append("junk")
+        data["resource_rewards"][0]["base_quantity"] = 0.0
+        
+        data = self.task.to_dict()
+        self.assertEqual(len(data["prerequisites"]), 1)
+        self.assertEqual(data["resource_rewards"][0]["base_quantity"], 10.0)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
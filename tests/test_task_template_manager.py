@@ -0,0 +1,155 @@
+"""
+Tests for the task template manager.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from src.core.task_template import TaskChain, TaskTemplate
+from src.core.task_template_manager import TaskTemplateManager, _read_json, _read_json_file
+
+CHAINS_DATA = [
+    {
+        "id": "basic_gathering",
+        "name": "Basic Gathering",
+        "description": "Gather basic materials",
+        "tasks": ["gather_wood", "gather_stone"]
+    }
+]
+
+# Listed out of chain order and without chain_id, like some shipped templates
+TEMPLATES_DATA = [
+    {
+        "id": "gather_stone",
+        "name": "Gather Stone",
+        "type": "GATHERING",
+        "base_duration_seconds": 1800
+    },
+    {
+        "id": "gather_wood",
+        "name": "Gather Wood",
+        "type": "GATHERING",
+        "base_duration_seconds": 1800
+    }
+]
+
+class TestChainTasks(unittest.TestCase):
+    """Test looking up the templates of a chain."""
+    def setUp(self):
+        self.manager = TaskTemplateManager.from_data(CHAINS_DATA, TEMPLATES_DATA)
+    
+    def test_chain_tasks_without_chain_id(self):
+        """Test that chain membership and order come from the chain's task list."""
+        for village_level in (1, 2):
+            chain_tasks = self.manager.get_chain_tasks(
+                "basic_gathering",
+                village_level=village_level,
+                completed_tasks=frozenset()
+            )
+            self.assertEqual(
+                [template.id for template in chain_tasks],
+                ["gather_wood", "gather_stone"]
+            )
+    
+    def test_chain_tasks_after_chain_replaced(self):
+        """Test that replacing a chain drops its cached task list."""
+        self.manager.get_chain_tasks("basic_gathering", 1, frozenset())
+        self.manager.add_chain(TaskChain(
+            id="basic_gathering",
+            name="Basic Gathering",
+            tasks=["gather_stone"]
+        ))
+        
+        chain_tasks = self.manager.get_chain_tasks("basic_gathering", 1, frozenset())
+        self.assertEqual([template.id for template in chain_tasks], ["gather_stone"])
+    
+    def test_unknown_chain(self):
+        """Test that an unknown chain has no tasks."""
+        self.assertEqual(self.manager.get_chain_tasks("missing", 1, frozenset()), [])
+
+class TestFromData(unittest.TestCase):
+    """Test managers built from already-parsed data."""
+    def test_save_without_directory(self):
+        """Test that saving a manager built from data writes no files."""
+        manager = TaskTemplateManager.from_data(CHAINS_DATA, TEMPLATES_DATA)
+        manager.add_template(TaskTemplate(id="gather_clay", name="Gather Clay"))
+        
+        with patch("src.core.task_template_manager._write_json") as write_json:
+            manager.save_templates()
+        
+        self.assertIsNone(manager.templates_dir)
+        write_json.assert_not_called()
+        self.assertIn("gather_clay", manager.task_templates)
+
+class TestTemplateSerialization(unittest.TestCase):
+    """Test saving templates and chains after they are modified."""
+    def test_modified_chain_to_dict(self):
+        """Test that a chain edited in place serializes its new tasks."""
+        chain = TaskChain.from_dict(CHAINS_DATA[0])
+        chain.to_dict()
+        chain.tasks.append("gather_clay")
+        self.assertEqual(chain.to_dict()["tasks"], ["gather_wood", "gather_stone", "gather_clay"])
+    
+    def test_modified_template_to_dict(self):
+        """Test that a template edited in place serializes its new values."""
+        template = TaskTemplate.from_dict(TEMPLATES_DATA[0])
+        template.to_dict()
+        template.skill_requirements["mining"] = 5.0
+        self.assertEqual(template.to_dict()["skill_requirements"], {"mining": 5.0})
+
+class TestGenerateTask(unittest.TestCase):
+    """Test generating tasks from templates."""
+    def test_saved_task_does_not_share_template_data(self):
+        """Test that changing a saved task leaves its template unchanged."""
+        manager = TaskTemplateManager.from_data(CHAINS_DATA, TEMPLATES_DATA)
+        template = manager.task_templates["gather_wood"]
+        template.skill_requirements["woodcutting"] = 1.0
+        task = manager.generate_task(template, datetime(2024, 6, 1, 12, 0))
+        
+        data = task.to_dict()
+        data["skill_requirements"]["mining"] = 9.0
+        data["weather_requirements"].append("STORM")
+        
+        self.assertEqual(template.skill_requirements, {"woodcutting": 1.0})
+        self.assertEqual(template.weather_requirements, [])
+        self.assertEqual(task.to_dict()["skill_requirements"], {"woodcutting": 1.0})
+
+class TestManagerState(unittest.TestCase):
+    """Test saving the template manager state."""
+    def test_state_after_direct_update(self):
+        """Test that completed chains added directly are saved."""
+        manager = TaskTemplateManager.from_data(CHAINS_DATA, TEMPLATES_DATA)
+        manager.to_dict()
+        manager.completed_chains.add("basic_gathering")
+        self.assertEqual(manager.to_dict()["completed_chains"], ["basic_gathering"])
+
+class TestReadJson(unittest.TestCase):
+    """Test the cache of parsed template files."""
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "task_chains.json")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_reuses_unchanged_file(self):
+        """Test that an unchanged file is parsed once and a changed one again."""
+        with open(self.path, 'w') as f:
+            json.dump(CHAINS_DATA, f)
+        first = _read_json(self.path)
+        self.assertIs(_read_json(self.path), first)
+        
+        with open(self.path, 'w') as f:
+            json.dump([], f)
+        self.assertEqual(_read_json(self.path), [])
+    
+    def test_cache_is_bounded(self):
+        """Test that parsed files are not kept for every path ever read."""
+        self.assertIsNotNone(_read_json_file.cache_info().maxsize)
+
+if __name__ == '__main__':
+    unittest.main()
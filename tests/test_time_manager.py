@@ -58,6 +58,15 @@ def test_time_manager_update():
     # Accumulator should be reset
     assert manager.accumulator < manager.fixed_time_step
 
+def test_time_manager_step():
+    """Test advancing TimeManager by one fixed step without real time passing."""
+    manager = TimeManager()
+    manager.time_scale = 60 / manager.fixed_time_step  # One game hour per step
+    
+    manager.step()
+    assert manager.game_date.hour == 7
+    assert manager.accumulator == 0.0
+
 def test_time_of_day():
     """Test time of day calculations."""
     manager = TimeManager()